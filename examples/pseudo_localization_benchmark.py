@@ -0,0 +1,79 @@
+'''
+Measures how the cost of rendering Labels scales with the length of their translations.
+
+Every Label in the kv tree below is rendered with pseudo translations of increasing length,
+including the creation and upload of its texture. The tree is never added to a window, so nothing is displayed,
+but creating the Labels opens one as usual, which means this needs a display (or e.g. ``xvfb-run`` on CI):
+
+    python pseudo_localization_benchmark.py
+'''
+
+import os
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+from time import perf_counter
+from textwrap import dedent
+
+from kivy.lang import Builder
+from kivy.uix.label import Label
+
+from kivy_garden.i18n.localizer import Localizer, MappingBasedTranslatorFactory, PseudoTranslatorFactory
+
+KV_CODE = dedent('''
+BoxLayout:
+    orientation: 'vertical'
+    Label:
+        font_name: l.font_name
+        font_size: 40
+        text: l._("app title")
+    BoxLayout:
+        Label:
+            font_name: l.font_name
+            text: l._("greeting")
+        Label:
+            font_name: l.font_name
+            text: l._("Hello {name}").format(name="Kivy")
+    Label:
+        font_name: l.font_name
+        text_size: 300, None
+        text: l._("description")
+''')
+
+TRANSLATIONS = {
+    "app title": {"en": "My First Kivy App", },
+    "greeting": {"en": "morning", },
+    "Hello {name}": {"en": "Hello {name}", },
+    "description": {"en": "This paragraph is long enough to be wrapped onto several lines by the text_size.", },
+}
+
+
+def render_labels(root, *, repeat=20) -> float:
+    '''
+    Re-renders every :class:`~kivy.uix.label.Label` in the tree, texture included, ``repeat`` times,
+    and returns the average seconds per round.
+    '''
+    labels = [w for w in root.walk() if isinstance(w, Label)]
+    start = perf_counter()
+    for __ in range(repeat):
+        for label in labels:
+            label.texture_update()
+    return (perf_counter() - start) / repeat
+
+
+def main():
+    base = MappingBasedTranslatorFactory(TRANSLATIONS)
+    print(f"{'expansion':>9} {'cjk':>5} {'chars':>6} {'ms/round':>9}")
+    for cjk_padding in (False, True):
+        for expansion in (0., 0.3, 1., 2., 4.):
+            factory = PseudoTranslatorFactory(base, expansion=expansion, cjk_padding=cjk_padding)
+            loc = Localizer(factory, font_picker=lambda lang: "Roboto")
+            loc.install(name='l')
+            try:
+                root = Builder.load_string(KV_CODE)
+            finally:
+                loc.uninstall(name='l')
+            n_chars = sum(len(w.text) for w in root.walk() if isinstance(w, Label))
+            print(f"{expansion:>9.1f} {str(cjk_padding):>5} {n_chars:>6} {render_labels(root) * 1000:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+'''
+Locale negotiation shared by :mod:`kivy_garden.i18n.fontfinder` and :mod:`kivy_garden.i18n.localizer`.
+'''
+
+__all__ = ("normalize_lang", "lang_fallbacks", )
+
+from functools import lru_cache
+
+
+IMPLICIT_SCRIPTS = {
+    'zh_CN': (v := 'zh_Hans'),
+    'zh_SG': v,
+    'zh_TW': (v := 'zh_Hant'),
+    'zh_HK': v,
+    'zh_MO': v,
+}
+'''
+地域だけが指定された時に補う文字体系。例えば ``zh_TW`` は ``zh_Hant`` に、``zh_CN`` は ``zh_Hans`` に後退する。
+'''
+del v
+
+
+@lru_cache(maxsize=256)
+def normalize_lang(lang: str) -> str:
+    '''
+    Converts a language tag into the form gettext uses.
+
+    .. code-block::
+
+        assert normalize_lang("zh-tw") == "zh_TW"
+        assert normalize_lang("zh-hant-tw") == "zh_Hant_TW"
+        assert normalize_lang("ja_JP.UTF-8") == "ja_JP"
+    '''
+    lang = lang.partition('.')[0].partition('@')[0]  # エンコーディングと修飾子は捨てる
+    subtags = lang.replace('-', '_').split('_')
+    normalized = [subtags[0].lower()]
+    for s in subtags[1:]:
+        if len(s) == 4 and s.isalpha():
+            normalized.append(s.title())  # 文字体系
+        elif len(s) == 2 or (len(s) == 3 and s.isdigit()):
+            normalized.append(s.upper())  # 地域
+        else:
+            normalized.append(s)
+    return '_'.join(normalized)
+
+
+@lru_cache(maxsize=256)
+def lang_fallbacks(lang: str, default: str=None) -> tuple[str, ...]:
+    '''
+    The languages to try, in order, when looking something up for ``lang``.
+
+    .. code-block::
+
+        assert lang_fallbacks("pt-BR") == ("pt_BR", "pt", )
+        assert lang_fallbacks("pt-BR", "en") == ("pt_BR", "pt", "en", )
+        assert lang_fallbacks("zh_TW") == ("zh_TW", "zh_Hant", "zh", )
+        assert lang_fallbacks("zh_Hant_TW") == ("zh_Hant_TW", "zh_Hant", "zh", )
+    '''
+    subtags = normalize_lang(lang).split('_')
+    chain = {}  # 順序付き集合として使う
+    while subtags:
+        lang = '_'.join(subtags)
+        chain[lang] = None
+        if (script := IMPLICIT_SCRIPTS.get(lang)) is not None:
+            chain[script] = None
+        subtags.pop()
+    if default is not None:
+        chain[normalize_lang(default)] = None
+    return tuple(chain)
@@ -0,0 +1,35 @@
+'''
+Format placeholders shared by :class:`kivy_garden.i18n.localizer.PseudoTranslatorFactory`
+and :func:`kivy_garden.i18n.utils.check_translations`.
+'''
+
+__all__ = ("PLACEHOLDER_PATTERN", "find_placeholders", )
+
+import re
+from collections import Counter
+
+
+PLACEHOLDER_PATTERN = re.compile(r"""
+    %%|\{\{|\}\}                                    # エスケープ。他の選択肢より先に試す必要がある。
+    |                                                # もしくは
+    %\([^)]*\)[-#0+]*\d*(?:\.\d+)?[diouxXeEfFgGcrsa]  # %(name)s
+    |                                                # もしくは
+    %[-#0+]*\d*(?:\.\d+)?[diouxXeEfFgGcrsa]          # %s %d %.2f
+    |                                                # もしくは
+    \{[^{}]*\}                                       # {} {name} {0:>10}
+""", re.VERBOSE)
+'''
+プレースホルダーとエスケープ (``%%``, ``{{``, ``}}``) に一致する。
+空白フラグ (``% d``) は ``"50% off"`` のような普通の文章と区別できないので対応しない。
+'''
+
+ESCAPES = frozenset(('%%', '{{', '}}', ))
+
+
+def find_placeholders(s: str) -> Counter:
+    '''
+    .. code-block::
+
+        assert find_placeholders("{name}: 100%% %(n)d {name}") == Counter({"{name}": 2, "%(n)d": 1})
+    '''
+    return Counter(m for m in PLACEHOLDER_PATTERN.findall(s) if m not in ESCAPES)
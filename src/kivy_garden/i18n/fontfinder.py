@@ -1,12 +1,14 @@
 __all__ =(
     "enum_pre_installed_fonts", "default_filter", "enum_langs", "register_lang",
-    "font_provides_glyphs", "font_supports_lang",
+    "font_provides_glyphs", "font_supports_lang", "fonts_support_langs",
+    "compute_font_coverage", "save_font_coverage", "load_font_coverage",
 )
 
 from typing import Union
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterator, Iterable, Mapping
 from pathlib import Path, PurePath
-from kivy.core.text import LabelBase, Label as CoreLabel
+
+from ._lang import normalize_lang, lang_fallbacks
 
 
 def default_filter(font: PurePath, suffixes={".ttf", ".otf", ".ttc", ".woff", ".woff2"}) -> bool:
@@ -20,6 +22,7 @@ def default_filter(font: PurePath, suffixes={".ttf", ".otf", ".ttc", ".woff", ".
 
 
 def enum_pre_installed_fonts(*, filter: Callable[[PurePath], bool]=default_filter) -> Iterator[Path]:
+    from kivy.core.text import LabelBase
     for dir in LabelBase.get_system_fonts_dir():
         for child in Path(dir).iterdir():
             if filter(child):
@@ -58,51 +61,148 @@ def font_provides_glyphs(font: str | Path, glyphs: str) -> bool:
     '''
     if not _validate_discriminant(glyphs):
         raise ValueError(f"'glyphs' must consist of three or more unique characters (was {glyphs!r})")
-    label = CoreLabel()
-    label._size = (16, 16, )
-    label.options['font_name'] = str(font)
-    label.resolve_font_name()
-    rendered_results = set()
-    for c in glyphs:
-        label.text = c
+    return _find_missing_glyphs(_GlyphProbe(font), glyphs) is None
+
+
+PROBE_WIDTH = 16
+PROBE_HEIGHT = 32
+'''
+一文字を描く枠の大きさ。
+文字が下にはみ出しても次の文字の枠に掛からないように、高さにはフォントの大きさ(12)の倍以上を取ってある。
+'''
+
+
+class _GlyphProbe:
+    '''
+    一つのフォントで文字を描き、その結果の hash 値を覚えておく。
+    同じ文字は何度判定に使われても一度しか描かない。
+    '''
+    __slots__ = ('_label', '_digests', )
+
+    def __init__(self, font: str | Path):
+        # kivy.core.text は読み込むだけでテキストプロバイダーが初期化されて重いので、必要になるまで読み込まない。
+        from kivy.core.text import Label as CoreLabel
+        label = CoreLabel()
+        label.options['font_name'] = str(font)
+        label.resolve_font_name()
+        self._label = label
+        self._digests = {}
+
+    def digests(self, glyphs: str) -> list[int]:
+        digests = self._digests
+        if (new_glyphs := [c for c in glyphs if c not in digests]):
+            digests.update(zip(new_glyphs, self._render(new_glyphs)))
+        return [digests[c] for c in glyphs]
+
+    def _render(self, glyphs: list[str]) -> list[int]:
+        '''
+        ``glyphs`` を縦に並べて一枚の画像に描き、各文字の枠の hash 値を返す。
+        文字毎に画像を作って画素を丸ごと保持するよりも確保と複写が少なく済む。
+        '''
+        label = self._label
+        n = len(glyphs)
+        label._size = (PROBE_WIDTH, PROBE_HEIGHT * n, )
         label._render_begin()
-        label._render_text(c, 0, 0)
-        pixels = label._render_end().data
-        if pixels in rendered_results:
-            return False
-        rendered_results.add(pixels)
-    return True
+        render_text = label._render_text
+        for i, c in enumerate(glyphs):
+            render_text(c, 0, PROBE_HEIGHT * i)
+        data = label._render_end().data
+        step = len(data) // n
+        # bytes を切り出すと枠毎に複写されるので、読み取り専用の memoryview のまま hash を取る。値は bytes の物と同じになる。
+        view = memoryview(data)
+        return [hash(view[offset:offset + step]) for offset in range(0, step * n, step)]
+
+
+def _find_missing_glyphs(probe: _GlyphProbe, glyphs: str, *, n_first=4) -> tuple[int, int] | None:
+    '''
+    フォントに無い文字は全て同じ豆腐として描かれるので、描画結果が一致した二文字を見つけた時点で打ち切り、その二文字の位置を返す。
+    全ての描画結果が異なっていれば None を返す。
+
+    失敗させやすい文字が先頭に並べられている事を期待して、まず先頭の ``n_first`` 文字だけを描き、
+    それらが全て異なっていた時のみ残りを描く。
+    '''
+    seen = {}
+    start = 0
+    for end in (n_first, len(glyphs)):
+        if start >= end:
+            continue
+        for i, digest in enumerate(probe.digests(glyphs[start:end]), start):
+            if digest in seen:
+                return (seen[digest], i)
+            seen[digest] = i
+        start = end
+    return None
 
 
 DISCRIMINANTS = {
-    'ar': 'الجزيرةAB',
-    'hi': 'भारतAB',
-    'ja': (v := '経伝説あAB'),
-    'ja-JP': v,
-    'ja_JP': v,
-    'ko': (v := '안녕조AB'),
-    'ko-KR': v,
-    'ko_KR': v,
-    'zh-Hans': (v := '哪经传说AB'),
-    'zh_Hans': v,
-    'zh-CN': v,
-    'zh_CN': v,
-    'zh-SG': v,
-    'zh_SG': v,
-    'zh-Hant': (v := '哪經傳說AB'),
-    'zh_Hant': v,
-    'zh-TW': v,
-    'zh_TW': v,
-    'zh-HK': v,
-    'zh_HK': v,
-    'zh-MO': v,
-    'zh_MO': v,
+    # Latin
+    'en': 'ABCXYZabcxyz',
+    'de': 'ÄÖÜäöüßAB',
+    'fr': 'ÀÇÉÈÊÎÔŒàçéèêëîïôœùûAB',
+    'es': 'ÁÉÍÑÓÚáéíñóú¿¡AB',
+    'it': 'ÀÈÉÌÒÙàèéìòùAB',
+    'pt': 'ÁÂÃÇÉÊÕáâãçéêõAB',
+    'pl': 'ĄĆĘŁŃŚŹŻąćęłńśźżAB',
+    'cs': 'ČĎĚŇŘŠŤŮŽčďěňřšťůžAB',
+    'hu': 'ÁÉÍÓÖŐÚÜŰáéíóöőúüűAB',
+    'ro': 'ĂÂÎȘȚăâîșțAB',
+    'tr': 'ÇĞİÖŞÜçğıöşüAB',
+    'vi': 'ĂÂĐÊÔƠƯăâđêôơưạảấầẩẫậắằẳẵặẹẻẽếềểễệAB',
+    # Greek, Cyrillic, Armenian, Georgian (ラテン文字と同じ形の文字は同じ描画結果になり得るので除いてある)
+    'el': 'ΓΔΘΛΞΠΣΦΨΩαβγδεζηθλξπσφψωAB',
+    'ru': (v := 'БГДЖЗИЙЛПФЦЧШЩЫЭЮЯбвгджзийлпфцчшщыэюяAB'),
+    'bg': v,
+    'uk': 'ЄЇҐБГДЖЗИЛПФЦЧШЩЮЯєїґбгджзилпфцчшщюяAB',
+    'be': 'ЎўБГДЖЗЙЛПФЦЧШЫЭЮЯбгджзйлпфцчшыэюяAB',
+    'sr': 'ЂЋЏЉЊђћџљњБГДЖЗИЛПФЦЧШбгджзилпфцчшAB',
+    'kk': 'ӘҒҚҢӨҰҮҺәғқңөұүһБГДЖЗИЛПAB',
+    'hy': 'ԱԲԳԴԵԶԷԸԹԺաբգդեզէըթժAB',
+    'ka': 'აბგდევზთიკლმნოპჟრსტუAB',
+    # Right-to-left
+    'ar': 'الجزيرةبتثحخدذسشصضطظعغفقكمنهوAB',
+    'fa': 'پچژگکیابتجدرسفلمنوAB',
+    'ur': 'ٹڈڑںھےپچگکابتجدرسAB',
+    'he': 'אבגדהוזחטיכלמנסעפצקרשתAB',
+    # Brahmic (結合文字は単独だと空の描画結果になり得るので、字幅を持つ文字だけを使う)
+    'hi': (v := 'भारतअआइकखगघचजटडणदनपमयलवशसहAB'),
+    'ne': v,
+    'mr': 'भारतळअआइकखगघचजटडणदनपमयलवशसहAB',
+    'bn': 'অআইউএকখগঘচছজটঠডণতথদধনপবমযরলশসহAB',
+    'pa': 'ਅਆਇਈਉਕਖਗਘਚਜਟਡਣਤਦਨਪਮਰਲਵਸਹAB',
+    'gu': 'અઆઇઈઉકખગઘચજટડણતદનપમરલવસહAB',
+    'or': 'ଅଆଇଈଉକଖଗଘଚଜଟଡଣତଦନପମରଲସହAB',
+    'ta': 'அஆஇஈஉஊஎஏஐஒகஙசஞடணதநபமயரலவழளறனAB',
+    'te': 'అఆఇఈఉకఖగఘచజటడణతదనపమరలవసహAB',
+    'kn': 'ಅಆಇಈಉಕಖಗಘಚಜಟಡಣತದನಪಮರಲವಸಹAB',
+    'ml': 'അആഇഈഉകഖഗഘചജടഡണതദനപമരലവസഹAB',
+    'si': 'අආඇඉඊඋකඛගඝචජටඩතදනපමරලවසහAB',
+    'th': 'กขคงจฉชซญดตถทนบปผพฟมยรลวสหอAB',
+    'lo': 'ກຂຄງຈຊຍດຕຖທນບປຜຝພຟມຢຣລວສຫອAB',
+    'km': 'កខគឃងចឆជឈញដឋឌឍណតថទធនបផពភមAB',
+    'my': 'ကခဂဃငစဆဇဈညဋဌဍဎဏတထဒဓနပဖဗဘမAB',
+    'am': 'ሀለሐመሠረሰሸቀበተቸኀነኘአከወዐዘየደጀገጠጨጰጸፀፈፐAB',
+    # CJK
+    'ja': '経伝説あいうえおアイウエオ円語AB',
+    'ko': '안녕조한글사랑국어AB',
+    'zh_Hans': '哪经传说这们来时国语AB',
+    'zh_Hant': '哪經傳說這們來時國語AB',
     'zh': '哪經傳說经传说AB',
 }
 '''
 あるフォントがある言語に対応しているか否かを判定するために使われる辞書。
 辞書の値に含まれている文字全てがフォントに含まれている時のみ、そのフォントは対応する鍵の言語に対応していると見做される。
+鍵は :func:`normalize_lang` で正規化された形で、``zh_TW`` のような地域付きの言語は :func:`lang_fallbacks` を通して ``zh_Hant`` に後退する。
 '''
+del v
+
+_lang2discriminant = {}
+'''
+font_supports_lang() に渡された言語から DISCRIMINANTS の値への解決済みの対応表。
+値の文字は判定に失敗させた回数の多い順に並べ替えられていくので、対応していないフォントほど早く弾かれる。
+'''
+
+_lang2miss_counts = {}
+'''font_supports_lang() に渡された言語から ``{文字: その文字で判定に失敗した回数}`` への対応表'''
 
 
 def font_supports_lang(font: Union[str, Path], lang: str) -> bool:
@@ -121,6 +221,10 @@ def font_supports_lang(font: Union[str, Path], lang: str) -> bool:
         assert f("NotoSerifCJK-Regular.ttc", "ko")
         assert f("NotoSerifCJK-Regular.ttc", "ja")
 
+        # Regional variants fall back to their language.
+        assert f("NotoSerifCJK-Regular.ttc", "zh-TW")
+        assert f("NotoSerifCJK-Regular.ttc", "ja_JP")
+
         # A font that lacks ASCII characters is considered unable to support any language.
         assert not f("DroidSansFallbackFull.ttf", "zh")
         assert not f("DroidSansFallbackFull.ttf", "ko")
@@ -130,17 +234,66 @@ def font_supports_lang(font: Union[str, Path], lang: str) -> bool:
 
         This function does not produce 100% accurate results.
     '''
-    try:
-        glyphs = DISCRIMINANTS[lang]
-    except KeyError:
-        raise ValueError(f"Unable to check language support: {lang = }.\n"
-                         "Register the language first using 'register_lang' function.")
-    return font_provides_glyphs(font, glyphs)
+    _prepare_lang(lang)
+    return _probe_lang(_GlyphProbe(font), lang)
+
+
+def fonts_support_langs(fonts: Iterable[Union[str, Path]], langs: Iterable[str]) -> list[list[bool]]:
+    '''
+    :func:`font_supports_lang` for many fonts and languages at once.
+    Each font is loaded only once.
+
+    .. code-block::
+
+        from kivy_garden.i18n.fontfinder import fonts_support_langs as f
+
+        assert f(["Roboto", "NotoSerifCJK-Regular.ttc"], ["en", "ja", "ko"]) == [
+            [True, False, False],
+            [True, True, True],
+        ]
+    '''
+    langs = tuple(langs)
+    for lang in langs:
+        _prepare_lang(lang)
+    return [
+        [_probe_lang(probe, lang) for lang in langs]
+        for probe in map(_GlyphProbe, fonts)
+    ]
+
+
+def _prepare_lang(lang: str, discriminant: str=None):
+    if lang in _lang2discriminant:
+        return
+    if discriminant is None:
+        discriminant = _resolve_discriminant(lang)
+    _lang2discriminant[lang] = discriminant
+    _lang2miss_counts[lang] = dict.fromkeys(discriminant, 0)
+
+
+def _probe_lang(probe: _GlyphProbe, lang: str) -> bool:
+    glyphs = _lang2discriminant[lang]
+    missing = _find_missing_glyphs(probe, glyphs)
+    if missing is None:
+        return True
+    counts = _lang2miss_counts[lang]
+    for i in missing:
+        counts[glyphs[i]] += 1
+    _lang2discriminant[lang] = ''.join(sorted(glyphs, key=counts.__getitem__, reverse=True))
+    return False
+
+
+def _resolve_discriminant(lang: str) -> str:
+    for l in lang_fallbacks(lang):
+        if l in DISCRIMINANTS:
+            return DISCRIMINANTS[l]
+    raise ValueError(f"Unable to check language support: {lang = }.\n"
+                     "Register the language first using 'register_lang' function.")
 
 
 def enum_langs() -> Iterator[str]:
     '''
     Available languages for :func:`font_supports_lang`.
+    Their regional variants, such as ``zh-TW`` for ``zh_Hant``, are accepted as well.
     '''
     return DISCRIMINANTS.keys()
 
@@ -151,11 +304,15 @@ def register_lang(lang: str, discriminant: str):
 
     .. code-block::
 
-        register_lang('th', "ราชอAB")  # Thai language
+        register_lang('bo', "ཀཁགངཅཆཇཉAB")  # Tibetan language
+
+    ``lang`` is normalized, so ``"pt-BR"`` and ``"pt_BR"`` register the same language.
     '''
     if not _validate_discriminant(discriminant):
         raise ValueError(f"'discriminant' must consist of three or more unique characters (was {discriminant!r})")
-    DISCRIMINANTS[lang] = discriminant
+    DISCRIMINANTS[normalize_lang(lang)] = discriminant
+    _lang2discriminant.clear()
+    _lang2miss_counts.clear()
 
 
 def _validate_discriminant(discriminant: str, len=len, set=set) -> bool:
@@ -163,6 +320,86 @@ def _validate_discriminant(discriminant: str, len=len, set=set) -> bool:
     return l >= 3 and len(set(discriminant)) == l
 
 
+FontCoverage = dict[str, tuple[str, ...]]
+'''``{font: languages the font supports}``'''
+
+
+def compute_font_coverage(fonts: Iterable[Union[str, Path]]=None, langs: Iterable[str]=None, *, max_workers: int=None) -> FontCoverage:
+    '''
+    Checks which of the ``langs`` each of the ``fonts`` supports, using multiple processes.
+
+    .. code-block::
+
+        from kivy_garden.i18n.fontfinder import compute_font_coverage
+
+        coverage = compute_font_coverage(["Roboto", "NotoSerifCJK-Regular.ttc"], ["ja", "ko"])
+        assert coverage == {"Roboto": (), "NotoSerifCJK-Regular.ttc": ("ja", "ko", )}
+
+    :param fonts: Defaults to :func:`enum_pre_installed_fonts`.
+    :param langs: Defaults to :func:`enum_langs`. They are normalized by the same rule ``DefaultFontPicker`` looks them up with,
+        so ``"zh-TW"`` is written as ``"zh_TW"``.
+    :param max_workers: Passed to :class:`concurrent.futures.ProcessPoolExecutor`.
+        If 1, the fonts are checked in the current process.
+    '''
+    fonts = [str(font) for font in (enum_pre_installed_fonts() if fonts is None else fonts)]
+    # 子プロセスには register_lang() で登録された言語が無いかもしれないので、判定用の文字列ごと渡す。
+    langs = dict.fromkeys(normalize_lang(lang) for lang in (enum_langs() if langs is None else langs))
+    langs = tuple((lang, _resolve_discriminant(lang)) for lang in langs)
+    if max_workers == 1 or len(fonts) < 2:
+        results = [_supported_langs(font, langs) for font in fonts]
+    else:
+        from itertools import repeat
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers) as executor:
+            results = list(executor.map(_supported_langs, fonts, repeat(langs)))
+    return dict(zip(fonts, results))
+
+
+def _supported_langs(font: str, langs: tuple[tuple[str, str], ...]) -> tuple[str, ...]:
+    for lang, glyphs in langs:
+        _prepare_lang(lang, glyphs)
+    try:
+        probe = _GlyphProbe(font)
+        return tuple(lang for lang, __ in langs if _probe_lang(probe, lang))
+    except Exception:
+        from kivy.logger import Logger
+        Logger.exception(f"kivy_garden.i18n: Failed to check the font {font!r}.")
+        return ()
+
+
+FONT_COVERAGE_FORMAT = "kivy_garden.i18n.font_coverage/1"
+
+
+def save_font_coverage(coverage: Mapping[str, Iterable[str]], file: Union[str, Path]):
+    '''
+    Writes the result of :func:`compute_font_coverage` to a file,
+    so that :class:`~kivy_garden.i18n.localizer.DefaultFontPicker` can load it instead of inspecting fonts at runtime.
+    '''
+    Path(file).write_text(_dump_font_coverage(coverage), encoding='utf-8')
+
+
+def _dump_font_coverage(coverage: Mapping[str, Iterable[str]]) -> str:
+    import json
+    data = {
+        "format": FONT_COVERAGE_FORMAT,
+        "fonts": {font: list(langs) for font, langs in coverage.items()},
+    }
+    return json.dumps(data, ensure_ascii=False, indent=1)
+
+
+def load_font_coverage(file: Union[str, Path]) -> FontCoverage:
+    '''
+    Reads a file written by :func:`save_font_coverage`.
+
+    :raises ValueError: if the file is not in the expected format.
+    '''
+    import json
+    data = json.loads(Path(file).read_text(encoding='utf-8'))
+    if not isinstance(data, dict) or data.get("format") != FONT_COVERAGE_FORMAT:
+        raise ValueError(f"{file} is not a font coverage file (expected format: {FONT_COVERAGE_FORMAT!r})")
+    return {font: tuple(langs) for font, langs in data["fonts"].items()}
+
+
 # Aliases for backward compatibility
 can_render_text = font_provides_glyphs
 can_render_lang = font_supports_lang
@@ -6,26 +6,30 @@ __all__ = (
     "FontNotFoundError",
 
     # concrete TranslatorFactory
-    "GettextBasedTranslatorFactory", "MappingBasedTranslatorFactory",
+    "GettextBasedTranslatorFactory", "MappingBasedTranslatorFactory", "PseudoTranslatorFactory",
 
     # concrete FontPicker
     "DefaultFontPicker",
 
     #
-    "Localizer",
+    "Localizer", "TranslationBundle",
 )
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, Iterable
+from collections import OrderedDict
 from typing import TypeAlias, Union
+from os import PathLike
 import itertools
+import math
 from functools import cached_property
 
 from kivy.properties import StringProperty, ObjectProperty
 from kivy.event import EventDispatcher
 from kivy.logger import Logger
-from kivy.uix.label import Label
 
-from .fontfinder import enum_pre_installed_fonts, font_supports_lang
+from .fontfinder import enum_pre_installed_fonts, font_supports_lang, load_font_coverage, FontCoverage
+from ._lang import normalize_lang, lang_fallbacks
+from .telemetry import LangSwitchEvent, TelemetrySink
 
 Msgid: TypeAlias = str
 Msgstr: TypeAlias = str
@@ -36,6 +40,16 @@ Font: TypeAlias = str
 FontPicker: TypeAlias = Callable[[Lang], Font]
 
 
+def _default_font_name() -> Font:
+    '''
+    The default value of :attr:`kivy.uix.label.Label.font_name`.
+    It is read from the config instead of the ``Label`` class because importing ``kivy.uix.label`` is slow.
+    '''
+    from ast import literal_eval
+    from kivy.config import Config
+    return literal_eval(Config.get('kivy', 'default_font'))[0]
+
+
 class FontNotFoundError(Exception):
     @cached_property
     def lang(self) -> Lang:
@@ -65,7 +79,7 @@ class Localizer(EventDispatcher):
     :meta public:
     '''
 
-    font_name: Font = StringProperty(Label.font_name.defaultvalue)
+    font_name: Font = StringProperty(_default_font_name())
     '''
     (read-only)
     A font that provides the glyphs required for rendering the "current language".
@@ -79,7 +93,16 @@ class Localizer(EventDispatcher):
         print(loc.font_name)  # => "<a pre-installed Korean font>"
     '''
 
-    def __init__(self, translator_factory: TranslatorFactory=None, *, lang: Lang='en', font_picker: FontPicker=None):
+    def __init__(self, translator_factory: TranslatorFactory=None, *, lang: Lang='en', font_picker: FontPicker=None,
+                 telemetry_sink: TelemetrySink=None, max_loaded_bundles: Union[int, None]=None):
+        '''
+        :param telemetry_sink:
+            If given, a :class:`~kivy_garden.i18n.telemetry.LangSwitchEvent` is passed to it every time ``lang`` changes.
+            See :mod:`kivy_garden.i18n.telemetry`.
+        :param max_loaded_bundles:
+            The maximum number of :class:`TranslationBundle` s that hold their translations at the same time.
+            When exceeded, the least recently used one unloads its translations. None means unlimited.
+        '''
         if translator_factory is None:
             Logger.warning(f"kivy_garden.i18n: No translator_factory was provided. Msgid's themselves will be displayed.")
             translator_factory = lambda lang: lambda msgid: msgid
@@ -87,6 +110,10 @@ class Localizer(EventDispatcher):
             font_picker = DefaultFontPicker()
         self.translator_factory = translator_factory
         self.font_picker = font_picker
+        self.telemetry_sink = telemetry_sink
+        self.max_loaded_bundles = max_loaded_bundles
+        self._bundles = {}
+        self._loaded_translators = OrderedDict()  # LRU の順に並んだ読み込み済みの _LazyTranslator
         super().__init__(lang=lang)
 
     def install(self, *, name):
@@ -119,74 +146,379 @@ class Localizer(EventDispatcher):
             raise ValueError(f"The object referenced by {name!r} is not me.")
         del global_idmap[name]
 
+    def add_bundle(self, name: str, translator_factory: TranslatorFactory, *, preload=False) -> 'TranslationBundle':
+        '''
+        Adds a sub-catalog that shares ``lang`` and ``font_name`` with this localizer,
+        but loads its translations only when one of its ``msgid`` is first looked up.
+        This lets each screen have its own catalog without loading the ones for screens the user never opens.
+
+        .. code-block::
+
+            loc = Localizer(...)
+            loc.add_bundle("settings", GettextBasedTranslatorFactory("settings", localedir)).install(name='ls')
+
+        .. code-block:: yaml
+
+            <SettingsScreen>:
+                Label:
+                    font_name: ls.font_name
+                    text: ls._("msgid")
+
+        If the ``translator_factory`` has a ``release(lang)`` method, it's called whenever the bundle drops its translations
+        (when ``lang`` changes, or by :meth:`unload_bundles` and ``max_loaded_bundles``) so that the factory can free them as well.
+        Every ``TranslatorFactory`` in this module has one.
+
+        :param preload: If True, the translations for the current language are loaded right away.
+        :raises ValueError: if the ``name`` has already been used.
+        '''
+        if name in self._bundles:
+            raise ValueError(f"The bundle {name!r} already exists.")
+        bundle = self._bundles[name] = TranslationBundle(self, name, translator_factory)
+        if preload:
+            bundle._._load()
+        return bundle
+
+    def get_bundle(self, name: str) -> 'TranslationBundle':
+        ''':raises KeyError: if the bundle doesn't exist.'''
+        return self._bundles[name]
+
+    def remove_bundle(self, name: str):
+        ''':raises KeyError: if the bundle doesn't exist.'''
+        self._bundles.pop(name)._.unload()
+
+    def unload_bundles(self):
+        '''
+        Makes every bundle drop its translations e.g. when the system is low on memory.
+        They are loaded again when needed.
+        '''
+        for translator in tuple(self._loaded_translators):
+            translator.unload()
+
+    def _on_bundle_loaded(self, translator: '_LazyTranslator'):
+        loaded = self._loaded_translators
+        loaded[translator] = None
+        max_loaded = self.max_loaded_bundles
+        if max_loaded is not None:
+            while len(loaded) > max_loaded:
+                next(iter(loaded)).unload()
+
+    def _update_bundles(self, lang) -> int:
+        '''Returns the number of the callbacks bound to the bundles that were triggered.'''
+        font_name = self.font_name
+        n_rules = 0
+        for bundle in self._bundles.values():
+            n_rules += bundle._switch(lang, font_name)
+        return n_rules
+
     @staticmethod
     def on_lang(self, lang):
         ''':meta private:'''
-        self._ = self.translator_factory(lang)
-        self.font_name = self.font_picker(lang)
+        if self.telemetry_sink is None:
+            self._ = self.translator_factory(lang)
+            self.font_name = self.font_picker(lang)
+            if self._bundles:
+                self._update_bundles(lang)
+        else:
+            self._on_lang_with_telemetry(lang)
+
+    def _on_lang_with_telemetry(self, lang):
+        from time import perf_counter
+        font_picker = self.font_picker
+        get_observers = self.get_property_observers
+
+        t0 = perf_counter()
+        translator = self.translator_factory(lang)
+        t1 = perf_counter()
+        n_rules = len(get_observers('_')) if translator != self._ else 0
+        self._ = translator
+        t2 = perf_counter()
+        n_cache_hits = getattr(font_picker, 'n_cache_hits', None)
+        n_fonts_probed = getattr(font_picker, 'n_fonts_probed', None)
+        font_name = font_picker(lang)
+        t3 = perf_counter()
+        if font_name != self.font_name:
+            n_rules += len(get_observers('font_name'))
+        self.font_name = font_name
+        n_rules += self._update_bundles(lang)
+        t4 = perf_counter()
+
+        self.telemetry_sink(LangSwitchEvent(
+            lang=lang,
+            translator_factory_time=t1 - t0,
+            font_picker_time=t3 - t2,
+            font_cache_hit=None if n_cache_hits is None else font_picker.n_cache_hits > n_cache_hits,
+            n_fonts_probed=None if n_fonts_probed is None else font_picker.n_fonts_probed - n_fonts_probed,
+            rebind_time=(t2 - t1) + (t4 - t3),
+            n_rebound_rules=n_rules,
+        ))
+
+
+class _LazyTranslator:
+    '''
+    A translator that asks its bundle's ``translator_factory`` for the real one the first time it's called.
+    '''
+    __slots__ = ('_bundle', '_lang', '_translator', '_mark_as_used', )
+
+    def __init__(self, bundle: 'TranslationBundle', lang: Lang):
+        self._bundle = bundle
+        self._lang = lang
+        self._translator = None
+        self._mark_as_used = bundle.localizer._loaded_translators.move_to_end
+
+    def __call__(self, msgid: Msgid) -> Msgstr:
+        translator = self._translator
+        if translator is None:
+            translator = self._load()
+        else:
+            self._mark_as_used(self)
+        return translator(msgid)
+
+    @property
+    def loaded(self) -> bool:
+        return self._translator is not None
+
+    def _load(self) -> Translator:
+        translator = self._translator
+        if translator is None:
+            bundle = self._bundle
+            translator = self._translator = bundle.translator_factory(self._lang)
+            bundle.localizer._on_bundle_loaded(self)
+        return translator
+
+    def unload(self):
+        if self._translator is not None:
+            self._translator = None
+            bundle = self._bundle
+            bundle.localizer._loaded_translators.pop(self, None)
+            # factory が翻訳表を抱えたままだと、ここで手放しても何も解放されない。
+            if (release := getattr(bundle.translator_factory, 'release', None)) is not None:
+                release(self._lang)
+
+
+class TranslationBundle(EventDispatcher):
+    '''
+    A sub-catalog of a :class:`Localizer`. Use :meth:`Localizer.add_bundle` to create one.
+    '''
+
+    lang: Lang = StringProperty()
+    '''(read-only) Same as the localizer's.'''
+
+    _: Translator = ObjectProperty()
+    '''
+    (read-only)
+    Same as :attr:`Localizer._` except that this one translates from the bundle's own catalog.
+
+    :meta public:
+    '''
+
+    font_name: Font = StringProperty()
+    '''(read-only) Same as the localizer's.'''
+
+    def __init__(self, localizer: Localizer, name: str, translator_factory: TranslatorFactory):
+        self.localizer = localizer
+        self.name = name
+        self.translator_factory = translator_factory
+        super().__init__()
+        self._switch(localizer.lang, localizer.font_name)
+
+    install = Localizer.install
+    uninstall = Localizer.uninstall
+
+    @property
+    def loaded(self) -> bool:
+        '''Whether the translations for the current language are loaded.'''
+        return self._.loaded
+
+    def _switch(self, lang: Lang, font_name: Font) -> int:
+        old = self._
+        if old is not None:
+            old.unload()
+        n_rules = len(self.get_property_observers('_'))
+        self._ = _LazyTranslator(self, lang)
+        if font_name != self.font_name:
+            n_rules += len(self.get_property_observers('font_name'))
+        self.lang = lang
+        self.font_name = font_name
+        return n_rules
 
 
 class DefaultFontPicker:
     PRESET = {
+        # Latin
         "en": (v := "Roboto"),
+        "cs": v,
+        "de": v,
+        "es": v,
         "fr": v,
+        "hu": v,
         "it": v,
+        "pl": v,
         "pt": v,
+        "ro": v,
+        "tr": v,
+        "vi": v,
+        # Greek
+        "el": v,
+        # Cyrillic
+        "be": v,
+        "bg": v,
+        "kk": v,
         "ru": v,
+        "sr": v,
+        "uk": v,
     }
     ''':meta private:'''
 
     del v
 
-    def __init__(self, *, fallback: Union[Lang, None]="Roboto"):
-        self._lang2font = self.PRESET.copy()
+    def __init__(self, *, fallback: Union[Lang, None]="Roboto", font_coverage: Union[FontCoverage, str, PathLike, None]=None):
+        '''
+        :param font_coverage:
+            The result of :func:`~kivy_garden.i18n.fontfinder.compute_font_coverage`,
+            or a file written by :func:`~kivy_garden.i18n.fontfinder.save_font_coverage` (e.g. by the ``font-coverage`` command).
+            Fonts are picked from it instead of being inspected at runtime.
+            Languages that none of its fonts support are still looked up at runtime.
+        '''
+        lang2font = self._lang2font = self.PRESET.copy()
         self._fallback = fallback
+        self.n_cache_hits = 0
+        '''The number of calls that were answered without inspecting any fonts.'''
+        self.n_fonts_probed = 0
+        '''The number of fonts that have been inspected so far.'''
+        if font_coverage is not None:
+            if not isinstance(font_coverage, Mapping):
+                font_coverage = load_font_coverage(font_coverage)
+            for font, langs in font_coverage.items():
+                for lang in langs:
+                    lang2font.setdefault(normalize_lang(lang), font)
 
     def __call__(self, lang: Lang) -> Font:
+        lang2font = self._lang2font
         try:
-            return self._lang2font[lang]
+            name = lang2font[lang]
+            self.n_cache_hits += 1
+            return name
         except KeyError:
             pass
-
-        name = None
-        for font in enum_pre_installed_fonts():
-            if font_supports_lang(font, lang):
-                name = font.name
-                break
+        for l in lang_fallbacks(lang):
+            if l in lang2font:
+                name = lang2font[lang] = lang2font[l]
+                self.n_cache_hits += 1
+                return name
+
+        # システムのフォントは並び順が不定なので、既定のフォントで足りるならそれを優先する。
+        self.n_fonts_probed += 1
+        name = _default_font_name()
+        if not font_supports_lang(name, lang):
+            name = None
+            for font in enum_pre_installed_fonts():
+                self.n_fonts_probed += 1
+                if font_supports_lang(font, lang):
+                    name = font.name
+                    break
         if name is None:
             fallback = self._fallback
             if fallback is None:
                 raise FontNotFoundError(lang)
             Logger.warning(f"kivy_garden.i18n: Couldn't find a font for lang '{lang}'. Use {fallback} as a fallback.")
             name = fallback
-        self._lang2font[lang] = name
+        lang2font[lang] = name
         return name
 
 
 class GettextBasedTranslatorFactory:
-    def __init__(self, domain, localedir):
+    def __init__(self, domain, localedir, *, default_lang: Union[Lang, None]=None):
+        '''
+        :param default_lang:
+            The language to fall back to when a ``msgid`` is found neither in the requested language
+            nor in its parent languages e.g. ``pt_BR`` → ``pt`` → ``default_lang``.
+        '''
         self.domain = domain
         self.localedir = localedir
+        self.default_lang = default_lang
+        self._translators = {}
 
     def __call__(self, lang: Lang) -> Translator:
-        from gettext import translation
-        return translation(domain=self.domain, localedir=self.localedir, languages=(lang, )).gettext
+        try:
+            return self._translators[lang]
+        except KeyError:
+            pass
+        from gettext import find, GNUTranslations
+        # gettext.translation() は読み込んだ catalog を模塊全体の cache に持ち続けて release() で解放できなくなるので、
+        # .mo を直接読む。gettext は翻訳が見つからない度に fallback を辿るので、予め一つの辞書に纏めておく。
+        mofiles = find(self.domain, self.localedir, languages=lang_fallbacks(lang, self.default_lang), all=True)
+        if not mofiles:
+            from errno import ENOENT
+            raise FileNotFoundError(ENOENT, 'No translation file found for domain', self.domain)
+        merged = {}
+        for mofile in reversed(mofiles):
+            with open(mofile, 'rb') as f:
+                merged.update(GNUTranslations(f)._catalog)
+        translator = self._translators[lang] = _make_gettext_like_translator(merged)
+        return translator
+
+    def release(self, lang: Lang):
+        '''Forgets the translations for the ``lang``. They are read from the files again the next time they're needed.'''
+        self._translators.pop(lang, None)
+
+
+def _make_gettext_like_translator(catalog: dict[Msgid, Msgstr]) -> Translator:
+    get = catalog.get
+
+    def translator(msgid: Msgid) -> Msgstr:
+        return get(msgid, msgid)
+    return translator
 
 
 class MappingBasedTranslatorFactory:
-    def __init__(self, translations: Mapping[Msgid, Mapping[Lang, Msgstr]], /, strict=False):
+    def __init__(self, translations: Mapping[Msgid, Mapping[Lang, Msgstr]], /, strict=False, *, default_lang: Union[Lang, None]=None):
         '''
         :param strict:
-            If False (default), a missing translation falls back to the ``msgid`` itself.
+            If False (default), a missing translation falls back to the parent languages (e.g. ``pt_BR`` → ``pt``),
+            then to ``default_lang``, then to the ``msgid`` itself.
             If True, a missing translation raises ``ValueError``.
+
+        The table for a language is built the first time the language is requested, and is dropped by :meth:`release`.
+        So the ``translations`` must not be modified afterwards.
         '''
-        self._compiled_translations = self._compile_translations(translations, strict=strict)
+        lang_keys = self._langs = {}  # 正規化された言語名 → translations 内での言語名 (``pt-BR`` と ``pt_BR`` の様に複数ありうる)
+        for l in set(itertools.chain.from_iterable(translations.values())):
+            lang_keys.setdefault(normalize_lang(l), []).append(l)
+        if strict:
+            for msgid, t in translations.items():
+                if len({normalize_lang(l) for l in t}) != len(lang_keys):
+                    raise ValueError(f"Msgid '{msgid}' is missing one or more translations")
+        self._translations = translations
+        self._default_lang = default_lang
+        self._translators = {}
 
     def __call__(self, lang: Lang) -> Translator:
-        return self._compiled_translations[lang].__getitem__
+        try:
+            return self._translators[lang]
+        except KeyError:
+            pass
+        lang_keys = self._langs
+        chain = [l for l in lang_fallbacks(lang, self._default_lang) if l in lang_keys]
+        if not chain:
+            raise KeyError(lang)
+        tables = self._compile_translations(self._translations, strict=False, langs=[k for l in chain for k in lang_keys[l]])
+        chain = [tables[l] for l in chain]
+        if len(chain[0]) == len(self._translations):
+            table = chain[0]
+        else:
+            # 言語を辿る処理を翻訳の度に行わずに済むよう、ここで一つの辞書に纏めておく。
+            table = {msgid: msgid for msgid in self._translations}
+            for t in reversed(chain):
+                table.update(t)
+        translator = self._translators[lang] = table.__getitem__
+        return translator
+
+    def release(self, lang: Lang):
+        '''Drops the table for the ``lang``. It's built again the next time it's needed.'''
+        self._translators.pop(lang, None)
 
     @staticmethod
-    def _compile_translations(d: Mapping[Msgid, Mapping[Lang, Msgstr]], *, strict) -> dict[Lang, dict[Msgid, Msgstr]]:
+    def _compile_translations(d: Mapping[Msgid, Mapping[Lang, Msgstr]], *, strict, langs: Iterable[Lang]=None) -> dict[Lang, dict[Msgid, Msgstr]]:
         '''
         アプリ開発者側にとって嬉しいのは次のような形式の翻訳表だと思うが
 
@@ -219,19 +551,116 @@ class MappingBasedTranslatorFactory:
             }
 
         この関数は前者を後者に変換する。
+        言語名は :func:`normalize_lang` で正規化され、``pt-BR`` と ``pt_BR`` の様に正規化すると同じになる言語の翻訳は一つに纏められる。
+        ``strict`` が偽の時は欠けている翻訳は後者に含まれない。
+        ``langs`` が与えられた時はそれらの言語だけを変換する。
         '''
         msgids = tuple(d.keys())
-        langs = set(itertools.chain.from_iterable(d.values()))
+        if langs is None:
+            langs = set(itertools.chain.from_iterable(d.values()))
+        tables = {}
+        for lang in langs:
+            table = tables.setdefault(normalize_lang(lang), {})
+            for msgid in msgids:
+                if lang in (t := d[msgid]):
+                    table[msgid] = t[lang]
         if strict:
+            for table in tables.values():
+                if len(table) != len(msgids):
+                    msgid = next(msgid for msgid in msgids if msgid not in table)
+                    raise ValueError(f"Msgid '{msgid}' is missing one or more translations")
+        return tables
+
+
+class PseudoTranslatorFactory:
+    ACCENTS = str.maketrans(
+        "ABCDEGHIJKLNOPRSTUWYZabcdeghijklnoprstuwyz",
+        "ÅƁÇÐÉĜĤÎĴĶĻÑÖÞŘŠŢÛŴÝŽåƀçðéĝĥîĵķļñöþŕšţûŵýž",
+    )
+    ''':meta private:'''
+
+    RLO = "\u202e"
+    ''':meta private:'''
+
+    PDF = "\u202c"
+    ''':meta private:'''
+
+    def __init__(self, translator_factory: TranslatorFactory=None, *, expansion=0.4, accents=True, rtl=False, cjk_padding=False):
+        '''
+        Produces pseudo translations, which are useful for testing layouts before real translations are available.
+
+        .. code-block::
+
+            factory = PseudoTranslatorFactory(MappingBasedTranslatorFactory(translations))
+            loc = Localizer(factory)
+            loc.lang = "en"
+            print(loc._("greeting"))  # => "[möŕñîñĝ ~~~]"
+
+        The same ``msgid`` always results in the same pseudo translation, and each one is computed only once.
+
+        :param translator_factory: The factory providing the texts to transform. If None, the ``msgid`` themselves are transformed.
+        :param expansion: How much longer the results are than the original texts. ``0.4`` means 40% longer.
+        :param accents: Whether to replace ASCII letters with accented ones.
+        :param rtl: Whether to wrap the results in right-to-left override markers.
+        :param cjk_padding: Whether to pad the results with CJK characters instead of ``~``.
+        '''
+        if expansion < 0:
+            raise ValueError(f"'expansion' must be zero or positive (was {expansion!r})")
+        self._translator_factory = translator_factory
+        self._expansion = expansion
+        self._accents = accents
+        self._rtl = rtl
+        self._padding = "漢字한글かな" if cjk_padding else "~"
+        self._translators = {}
+
+    def __call__(self, lang: Lang) -> Translator:
+        try:
+            return self._translators[lang]
+        except KeyError:
+            pass
+        factory = self._translator_factory
+        translate = (lambda msgid: msgid) if factory is None else factory(lang)
+        pseudo_translate = self.pseudo_translate
+        cache = {}
+
+        def translator(msgid: Msgid) -> Msgstr:
             try:
-                return {
-                    lang: {msgid: d[msgid][lang] for msgid in msgids}
-                    for lang in langs
-                }
-            except KeyError as e:
-                raise ValueError(f"Msgid '{e.args[0]}' is missing one or more translations") from e
-        else:
-            return {
-                lang: {msgid: d[msgid].get(lang, msgid) for msgid in msgids}
-                for lang in langs
-            }
+                return cache[msgid]
+            except KeyError:
+                msgstr = cache[msgid] = pseudo_translate(translate(msgid))
+                return msgstr
+        self._translators[lang] = translator
+        return translator
+
+    def release(self, lang: Lang):
+        '''Drops the pseudo translations for the ``lang``, and lets the wrapped factory release its translations as well.'''
+        self._translators.pop(lang, None)
+        if (release := getattr(self._translator_factory, 'release', None)) is not None:
+            release(lang)
+
+    def pseudo_translate(self, text: str) -> str:
+        '''
+        .. code-block::
+
+            f = PseudoTranslatorFactory(expansion=0.5)
+            assert f.pseudo_translate("Hello {name}") == "[Ĥéļļö {name} ~~~~~~]"
+        '''
+        if self._accents:
+            from ._placeholders import PLACEHOLDER_PATTERN
+            # プレースホルダーは置き換えると壊れるので、それ以外の部分だけを置き換える。
+            table = self.ACCENTS
+            pieces = []
+            last = 0
+            for m in PLACEHOLDER_PATTERN.finditer(text):
+                pieces.append(text[last:m.start()].translate(table))
+                pieces.append(m.group())
+                last = m.end()
+            pieces.append(text[last:].translate(table))
+            text = ''.join(pieces)
+        if (n := math.ceil(len(text) * self._expansion)):
+            padding = self._padding
+            text = f"{text} {(padding * (n // len(padding) + 1))[:n]}"
+        text = f"[{text}]"
+        if self._rtl:
+            text = f"{self.RLO}{text}{self.PDF}"
+        return text
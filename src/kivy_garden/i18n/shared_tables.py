@@ -0,0 +1,329 @@
+'''
+Translation tables shared between processes through :mod:`multiprocessing.shared_memory`.
+
+One process publishes the tables:
+
+.. code-block::
+
+    from kivy_garden.i18n.shared_tables import SharedTablePublisher
+
+    publisher = SharedTablePublisher("myapp_i18n")
+    publisher.publish(translations)  # the same form as MappingBasedTranslatorFactory takes
+
+and the others look them up without copying them:
+
+.. code-block::
+
+    from kivy_garden.i18n.localizer import Localizer
+    from kivy_garden.i18n.shared_tables import SharedTableTranslatorFactory
+
+    loc = Localizer(SharedTableTranslatorFactory("myapp_i18n"))
+
+Calling :meth:`SharedTablePublisher.publish` again replaces the tables.
+Each factory switches to the new ones the next time it's called, which is the next time ``Localizer.lang`` changes,
+or when :meth:`SharedTableTranslatorFactory.refresh` is called:
+
+.. code-block::
+
+    from kivy.clock import Clock
+
+    factory = SharedTableTranslatorFactory("myapp_i18n")
+    loc = Localizer(factory)
+    Clock.schedule_interval(lambda dt: factory.refresh(loc), 1)
+'''
+
+__all__ = ("SharedTablePublisher", "SharedTableTranslatorFactory", )
+
+import sys
+import struct
+from zlib import crc32
+from collections.abc import Mapping
+from multiprocessing.shared_memory import SharedMemory
+
+from ._lang import normalize_lang, lang_fallbacks
+
+CONTROL = struct.Struct('<8sQ32s')
+'''共有メモリの名前が利用者に公開される小さな領域: magic, 版, 表本体が置かれている共有メモリの名前'''
+CONTROL_MAGIC = b'KGI18NC1'
+
+HEADER = struct.Struct('<8sQIIIQQQQQI')
+'''表本体の先頭: magic, 版, 言語数, msgid数, hash表の枠数, 各区画の位置(言語名, hash表, msgid, 翻訳表), default_lang への参照'''
+HEADER_MAGIC = b'KGI18NT1'
+
+REF = struct.Struct('<QI')
+'''文字列への参照: 位置, UTF-8での長さ'''
+SLOT = struct.Struct('<I')
+'''hash表の枠: msgidの番号 + 1 (0は空)'''
+MISSING = 0xFFFFFFFF
+'''翻訳が無い事を表す長さ。msgid自体が返される。default_lang が無い事も表す。'''
+
+_created_names = set()
+'''このプロセスの SharedTablePublisher が作って、まだ unlink していない共有メモリの名前'''
+
+
+def _attach(name: str) -> SharedMemory:
+    '''
+    Attaches to an existing segment without letting the resource tracker unlink it when this process exits.
+    '''
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    shm = SharedMemory(name)
+    # resource tracker は名前を集合で管理しているので、作成者と同じ tracker で登録を取り消すと作成者側の保護まで外れてしまう。
+    # multiprocessing で起動されたプロセスは親の tracker を引き継いでいるので、自分で作った物と同様に取り消さない。
+    if name in _created_names or _inherits_resource_tracker():
+        return shm
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+
+def _inherits_resource_tracker() -> bool:
+    from multiprocessing import parent_process
+    return parent_process() is not None
+
+
+def _create(name: str=None, size: int=0) -> SharedMemory:
+    shm = SharedMemory(name, create=True, size=size)
+    _created_names.add(shm.name)
+    return shm
+
+
+def _unlink(shm: SharedMemory):
+    shm.close()
+    shm.unlink()
+    _created_names.discard(shm.name)
+
+
+def _compile(translations: Mapping[str, Mapping[str, str]], default_lang: str | None, version: int) -> bytearray:
+    msgids = tuple(translations.keys())
+    tables = {}
+    for msgid, d in translations.items():
+        for lang, msgstr in d.items():
+            tables.setdefault(normalize_lang(lang), {})[msgid] = msgstr
+    langs = tuple(tables)
+    n_msgids = len(msgids)
+    n_slots = 8
+    while n_slots < n_msgids * 2:
+        n_slots *= 2
+
+    langs_off = HEADER.size
+    slots_off = langs_off + REF.size * len(langs)
+    msgids_off = slots_off + SLOT.size * n_slots
+    tables_off = msgids_off + REF.size * n_msgids
+    blob_off = tables_off + REF.size * n_msgids * len(langs)
+
+    blob = bytearray()
+    refs = {}  # 同じ文字列は一度だけ格納する
+
+    def ref_of(s: str) -> tuple[int, int]:
+        try:
+            return refs[s]
+        except KeyError:
+            data = s.encode('utf-8')
+            r = refs[s] = (blob_off + len(blob), len(data))
+            blob.extend(data)
+            return r
+
+    buf = bytearray(blob_off)
+    default_ref = (0, MISSING) if default_lang is None else ref_of(normalize_lang(default_lang))
+    HEADER.pack_into(buf, 0, HEADER_MAGIC, version, len(langs), n_msgids, n_slots, langs_off, slots_off, msgids_off, tables_off, *default_ref)
+    for i, lang in enumerate(langs):
+        REF.pack_into(buf, langs_off + REF.size * i, *ref_of(lang))
+    mask = n_slots - 1
+    for i, msgid in enumerate(msgids):
+        REF.pack_into(buf, msgids_off + REF.size * i, *ref_of(msgid))
+        h = crc32(msgid.encode('utf-8')) & mask
+        while SLOT.unpack_from(buf, slots_off + SLOT.size * h)[0]:
+            h = (h + 1) & mask
+        SLOT.pack_into(buf, slots_off + SLOT.size * h, i + 1)
+    for lang_index, lang in enumerate(langs):
+        # 欠けている翻訳は親の言語 (pt_BR → pt) と default_lang から予め補っておく。
+        chain = [tables[l] for l in lang_fallbacks(lang, default_lang) if l in tables]
+        base = tables_off + REF.size * n_msgids * lang_index
+        for i, msgid in enumerate(msgids):
+            for t in chain:
+                if msgid in t:
+                    REF.pack_into(buf, base + REF.size * i, *ref_of(t[msgid]))
+                    break
+            else:
+                REF.pack_into(buf, base + REF.size * i, 0, MISSING)
+    buf.extend(blob)
+    return buf
+
+
+class SharedTablePublisher:
+    def __init__(self, name: str):
+        '''
+        :param name: The name the other processes pass to :class:`SharedTableTranslatorFactory`.
+        '''
+        self.name = name
+        self._control = _create(name, CONTROL.size)
+        self._data = None
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        '''The version of the currently published tables. 0 if nothing has been published yet.'''
+        return self._version
+
+    def publish(self, translations: Mapping[str, Mapping[str, str]], /, *, default_lang: str | None=None) -> int:
+        '''
+        Publishes the tables, replacing the previous ones.
+
+        :param translations: The same form as :class:`~kivy_garden.i18n.localizer.MappingBasedTranslatorFactory` takes.
+            :func:`kivy_garden.i18n.utils.load_catalogs` can create one from gettext catalogs.
+        :param default_lang: See :class:`~kivy_garden.i18n.localizer.MappingBasedTranslatorFactory`.
+        :returns: The new version.
+
+        The factories that are already in use don't switch to the new tables until their ``Localizer.lang`` changes,
+        or :meth:`SharedTableTranslatorFactory.refresh` is called.
+        '''
+        version = self._version + 1
+        content = _compile(translations, default_lang, version)
+        data = _create(size=len(content))
+        data.buf[:len(content)] = content
+        data_name = data.name.encode('ascii')
+        if len(data_name) > 32:
+            _unlink(data)
+            raise RuntimeError(f"The name of a shared memory segment is too long: {data.name!r}")
+        CONTROL.pack_into(self._control.buf, 0, CONTROL_MAGIC, version, data_name)
+        old = self._data
+        self._data = data
+        self._version = version
+        if old is not None:
+            # 既に接続しているプロセスからは、切断するまで古い表が見え続ける。
+            _unlink(old)
+        return version
+
+    def close(self):
+        '''Removes the tables. The processes that have already attached can keep using them.'''
+        if (data := self._data) is not None:
+            self._data = None
+            _unlink(data)
+        if (control := self._control) is not None:
+            self._control = None
+            _unlink(control)
+
+
+class _SharedTable:
+    '''An attached version of the tables.'''
+
+    def __init__(self, shm: SharedMemory):
+        buf = shm.buf
+        magic, version, n_langs, n_msgids, n_slots, langs_off, slots_off, msgids_off, tables_off, default_off, default_len = HEADER.unpack_from(buf, 0)
+        if magic != HEADER_MAGIC:
+            raise ValueError(f"{shm.name!r} doesn't contain translation tables.")
+        self.shm = shm
+        self.version = version
+        self.default_lang = None if default_len == MISSING else str(buf[default_off:default_off + default_len], 'utf-8')
+        self.n_msgids = n_msgids
+        self.n_slots = n_slots
+        self.slots_off = slots_off
+        self.msgids_off = msgids_off
+        self.tables_off = tables_off
+        self.lang_indices = {
+            str(buf[off:off + length], 'utf-8'): i
+            for i, (off, length) in enumerate(REF.iter_unpack(buf[langs_off:langs_off + REF.size * n_langs]))
+        }
+
+
+class _SharedTableTranslator:
+    __slots__ = ('_table', '_buf', '_mask', '_slots_off', '_msgids_off', '_lang_off', )
+
+    def __init__(self, table: _SharedTable, lang_index: int):
+        self._table = table  # 共有メモリを開いたままにしておくため
+        self._buf = table.shm.buf
+        self._mask = table.n_slots - 1
+        self._slots_off = table.slots_off
+        self._msgids_off = table.msgids_off
+        self._lang_off = table.tables_off + REF.size * table.n_msgids * lang_index
+
+    def __call__(self, msgid: str, *, crc32=crc32, unpack_slot=SLOT.unpack_from, unpack_ref=REF.unpack_from) -> str:
+        buf = self._buf
+        key = msgid.encode('utf-8')
+        mask = self._mask
+        h = crc32(key) & mask
+        while (index := unpack_slot(buf, self._slots_off + 4 * h)[0]):
+            off, length = unpack_ref(buf, self._msgids_off + 12 * (index - 1))
+            if length == len(key) and buf[off:off + length] == key:
+                off, length = unpack_ref(buf, self._lang_off + 12 * (index - 1))
+                return msgid if length == MISSING else str(buf[off:off + length], 'utf-8')
+            h = (h + 1) & mask
+        return msgid
+
+
+class SharedTableTranslatorFactory:
+    def __init__(self, name: str):
+        '''
+        :param name: The name passed to :class:`SharedTablePublisher`.
+        :raises FileNotFoundError: if no publisher with that name exists.
+        '''
+        self.name = name
+        self._control = _attach(name)
+        self._table = None
+        self._translators = {}
+
+    @property
+    def version(self) -> int:
+        '''The version of the tables this factory is using. 0 if it hasn't used any yet.'''
+        return 0 if self._table is None else self._table.version
+
+    def __call__(self, lang: str):
+        table = self._refresh()
+        try:
+            return self._translators[lang]
+        except KeyError:
+            pass
+        lang_indices = table.lang_indices
+        for l in lang_fallbacks(lang, table.default_lang):
+            if l in lang_indices:
+                break
+        else:
+            raise KeyError(lang)
+        translator = self._translators[lang] = _SharedTableTranslator(table, lang_indices[l])
+        return translator
+
+    def release(self, lang: str):
+        '''Forgets the translator for the ``lang``. The tables themselves stay attached as other processes share them.'''
+        self._translators.pop(lang, None)
+
+    def refresh(self, localizer=None) -> bool:
+        '''
+        Switches to the latest tables if newer ones have been published.
+        This only reads a few bytes from the shared memory unless there are newer tables, so it's cheap enough to poll.
+
+        :param localizer: If given, the ``_`` of it and of its bundles that use this factory are replaced as well,
+            so that the kv rules bound to them pick up the new translations.
+        :returns: Whether this factory switched to newer tables.
+        '''
+        old = self._table
+        if self._refresh() is old:
+            return False
+        if localizer is not None:
+            if localizer.translator_factory is self:
+                localizer._ = self(localizer.lang)
+            for bundle in localizer._bundles.values():
+                if bundle.translator_factory is self:
+                    bundle._switch(bundle.lang, bundle.font_name)
+        return True
+
+    def _refresh(self) -> _SharedTable:
+        table = self._table
+        for __ in range(10):
+            magic, version, data_name = CONTROL.unpack_from(self._control.buf, 0)
+            if magic != CONTROL_MAGIC:
+                raise LookupError(f"Nothing has been published to {self.name!r} yet.")
+            if table is not None and table.version == version:
+                return table
+            try:
+                new_table = _SharedTable(_attach(data_name.rstrip(b'\0').decode('ascii')))
+            except FileNotFoundError:
+                continue  # 読んでいる間に差し替えられた
+            if new_table.version == version:
+                self._table = new_table
+                self._translators = {}
+                return new_table
+        raise RuntimeError(f"The tables in {self.name!r} keep changing.")
@@ -0,0 +1,74 @@
+'''
+Timings of the work a :class:`~kivy_garden.i18n.localizer.Localizer` does when its ``lang`` changes.
+
+.. code-block::
+
+    from kivy_garden.i18n.localizer import Localizer
+    from kivy_garden.i18n.telemetry import RingBufferSink
+
+    sink = RingBufferSink(maxlen=10)
+    loc = Localizer(..., telemetry_sink=sink)
+    loc.lang = "ja"
+    event = sink.events[-1]
+    print(event.translator_factory_time, event.font_picker_time, event.rebind_time)
+
+A sink is any callable that takes a :class:`LangSwitchEvent`, so a plain function works as a callback as well.
+When no sink is given, the ``Localizer`` doesn't measure anything.
+'''
+
+__all__ = ("LangSwitchEvent", "TelemetrySink", "log_sink", "RingBufferSink", )
+
+from typing import NamedTuple, TypeAlias, Union
+from collections.abc import Callable
+from collections import deque
+
+
+class LangSwitchEvent(NamedTuple):
+    lang: str
+    '''The new language.'''
+
+    translator_factory_time: float
+    '''Seconds spent in ``translator_factory``.'''
+
+    font_picker_time: float
+    '''Seconds spent in ``font_picker``.'''
+
+    font_cache_hit: Union[bool, None]
+    '''Whether the font picker answered without inspecting any fonts. None if the font picker doesn't tell.'''
+
+    n_fonts_probed: Union[int, None]
+    '''The number of fonts the font picker inspected. None if the font picker doesn't tell.'''
+
+    rebind_time: float
+    '''Seconds spent in the callbacks bound to ``_`` and ``font_name``, which include the kv rules.'''
+
+    n_rebound_rules: int
+    '''The number of callbacks bound to ``_`` and ``font_name`` that were triggered.'''
+
+    @property
+    def total_time(self) -> float:
+        return self.translator_factory_time + self.font_picker_time + self.rebind_time
+
+
+TelemetrySink: TypeAlias = Callable[[LangSwitchEvent], None]
+
+
+def log_sink(event: LangSwitchEvent):
+    '''A sink that writes events to :data:`kivy.logger.Logger`.'''
+    from kivy.logger import Logger
+    Logger.info(
+        f"kivy_garden.i18n: Switched to lang '{event.lang}' in {event.total_time * 1000:.2f}ms "
+        f"(translator_factory: {event.translator_factory_time * 1000:.2f}ms, "
+        f"font_picker: {event.font_picker_time * 1000:.2f}ms, cache hit: {event.font_cache_hit}, fonts probed: {event.n_fonts_probed}, "
+        f"rebind: {event.rebind_time * 1000:.2f}ms, rules: {event.n_rebound_rules})"
+    )
+
+
+class RingBufferSink:
+    '''A sink that keeps the latest ``maxlen`` events in memory.'''
+
+    def __init__(self, maxlen=100):
+        self.events: deque[LangSwitchEvent] = deque(maxlen=maxlen)
+
+    def __call__(self, event: LangSwitchEvent):
+        self.events.append(event)
@@ -1 +1,2 @@
 from ._extract_msgids_from_string_literals import extract_msgids_from_string_literals
+from ._check_translations import check_translations, load_catalogs, TranslationReport
@@ -0,0 +1,200 @@
+__all__ = ('check_translations', 'load_catalogs', 'TranslationReport', )
+
+import re
+from typing import NamedTuple
+from collections.abc import Mapping, Iterable
+from pathlib import Path
+
+from .._placeholders import find_placeholders
+
+
+class TranslationReport(NamedTuple):
+    langs: tuple[str, ...]
+    '''The languages that were checked.'''
+
+    n_msgids: int
+    '''The number of msgids that were checked.'''
+
+    missing: dict[str, list[str]]
+    '''``{lang: [msgids that have no translation in that lang]}``'''
+
+    empty: dict[str, list[str]]
+    '''``{lang: [msgids whose translation in that lang is an empty string]}``'''
+
+    placeholder_mismatches: dict[str, list[str]]
+    '''``{lang: [msgids whose translation in that lang has different placeholders from the msgid]}``'''
+
+    @property
+    def coverage(self) -> dict[str, float]:
+        '''``{lang: the percentage of msgids that have a non-empty translation in that lang}``'''
+        n = self.n_msgids
+        if not n:
+            return {lang: 100. for lang in self.langs}
+        missing = self.missing
+        empty = self.empty
+        return {
+            lang: 100. * (n - len(missing[lang]) - len(empty[lang])) / n
+            for lang in self.langs
+        }
+
+    @property
+    def ok(self) -> bool:
+        '''Whether no problems were found.'''
+        return not any(
+            any(d.values())
+            for d in (self.missing, self.empty, self.placeholder_mismatches)
+        )
+
+
+def check_translations(translations: Mapping[str, Mapping[str, str]], /, langs: Iterable[str]=None) -> TranslationReport:
+    '''
+    Finds all the problems in a translation table in a single pass.
+
+    .. code-block::
+
+        report = check_translations({
+            "greeting": {"ja": "おはよう", "en": "morning", },
+            "hello {name}": {"ja": "こんにちは", "en": "", },
+            "apple": {"ja": "林檎", },
+        })
+        assert report.missing == {"ja": [], "en": ["apple"], }
+        assert report.empty == {"ja": [], "en": ["hello {name}"], }
+        assert report.placeholder_mismatches == {"ja": ["hello {name}"], "en": [], }
+
+    :param translations: A table of the same form as the one :class:`~kivy_garden.i18n.localizer.MappingBasedTranslatorFactory` takes.
+        :func:`load_catalogs` can create one from ``.po`` or ``.mo`` files.
+    :param langs: The languages to check. If omitted, every language that appears in ``translations`` is checked.
+    '''
+    if langs is None:
+        langs = {lang for d in translations.values() for lang in d}
+        langs = tuple(sorted(langs))
+    else:
+        langs = tuple(langs)
+    missing = {lang: [] for lang in langs}
+    empty = {lang: [] for lang in langs}
+    mismatches = {lang: [] for lang in langs}
+    lang_and_lists = tuple((lang, missing[lang], empty[lang], mismatches[lang]) for lang in langs)
+    for msgid, d in translations.items():
+        expected = None
+        for lang, missing_, empty_, mismatches_ in lang_and_lists:
+            msgstr = d.get(lang)
+            if msgstr is None:
+                missing_.append(msgid)
+            elif not msgstr:
+                empty_.append(msgid)
+            else:
+                if expected is None:
+                    expected = find_placeholders(msgid)
+                if (expected or '%' in msgstr or '{' in msgstr) and find_placeholders(msgstr) != expected:
+                    mismatches_.append(msgid)
+    return TranslationReport(langs, len(translations), missing, empty, mismatches)
+
+
+def load_catalogs(domain: str, localedir, langs: Iterable[str]=None) -> dict[str, dict[str, str]]:
+    '''
+    Loads ``<localedir>/<lang>/LC_MESSAGES/<domain>.po`` (or ``.mo`` if the former doesn't exist) for each language,
+    and merges them into a table that :func:`check_translations` can take.
+    Fuzzy entries in ``.po`` files are treated as missing, as ``msgfmt`` leaves them out of ``.mo`` files.
+
+    :param langs: The languages to load. If omitted, every language that has a catalog in ``localedir`` is loaded.
+    '''
+    localedir = Path(localedir)
+    if langs is None:
+        langs = sorted(
+            child.name for child in localedir.iterdir()
+            if child.is_dir() and any((child / "LC_MESSAGES" / (domain + suffix)).is_file() for suffix in (".po", ".mo"))
+        )
+    translations = {}
+    for lang in langs:
+        prefix = localedir / lang / "LC_MESSAGES" / domain
+        if (po := prefix.with_suffix(".po")).is_file():
+            catalog = _load_po(po)
+        else:
+            catalog = _load_mo(prefix.with_suffix(".mo"))
+        for msgid, msgstr in catalog.items():
+            if msgid:  # ヘッダーは除く
+                translations.setdefault(msgid, {})[lang] = msgstr
+    return translations
+
+
+def _load_mo(path: Path) -> dict[str, str]:
+    from gettext import GNUTranslations
+    with path.open('rb') as f:
+        catalog = GNUTranslations(f)._catalog
+    # 複数形の翻訳は (msgid, n) を鍵として格納されているので n == 0 の物だけを採る
+    return {
+        (key if isinstance(key, str) else key[0]): msgstr
+        for key, msgstr in catalog.items()
+        if isinstance(key, str) or key[1] == 0
+    }
+
+
+PO_LINE_PATTERN = re.compile(r'^(msgctxt|msgid|msgid_plural|msgstr(?:\[(\d+)\])?)?\s*(".*")\s*$')
+
+
+def _load_po(path: Path) -> dict[str, str]:
+    from ast import literal_eval
+    catalog = {}
+    entry = {}
+    keyword = None
+    fuzzy = False
+
+    def flush():
+        nonlocal fuzzy
+        # msgfmt と同じく fuzzy な翻訳は無い物として扱う。ただしヘッダーは除く。
+        if 'msgid' in entry and 'msgstr' in entry and not (fuzzy and entry['msgid']):
+            msgid = entry['msgid']
+            if 'msgctxt' in entry:
+                msgid = entry['msgctxt'] + '\x04' + msgid
+            catalog[msgid] = entry['msgstr']
+        entry.clear()
+        fuzzy = False
+
+    for line in path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] == '#':
+            # コメントは次の項目の一部なので、前の項目はここで終わる。
+            if 'msgstr' in entry:
+                flush()
+            if line.startswith('#,') and 'fuzzy' in (flag.strip() for flag in line[2:].split(',')):
+                fuzzy = True
+            continue
+        m = PO_LINE_PATTERN.match(line)
+        if m is None:
+            raise ValueError(f"{path}: Unable to parse the line: {line!r}")
+        kw, plural_index, literal = m.groups()
+        if kw is not None:
+            if kw in ('msgctxt', 'msgid') and 'msgstr' in entry:
+                flush()
+            if plural_index is not None:
+                # 複数形の翻訳は最初の物だけを採る
+                kw = 'msgstr' if plural_index == '0' else None
+            keyword = kw
+            if keyword is not None:
+                entry[keyword] = ''
+        if keyword is not None:
+            entry[keyword] += literal_eval(literal)
+    flush()
+    return catalog
+
+
+def cli_main():
+    from textwrap import dedent
+    import sys
+
+    if len(sys.argv) != 3:
+        print(dedent("""
+            Usage:
+                check-translations domain localedir
+            """),
+            file=sys.stderr)
+        return 2
+    report = check_translations(load_catalogs(sys.argv[1], sys.argv[2]))
+    for lang, coverage in report.coverage.items():
+        print(f"{lang}: {coverage:.1f}%")
+        for label, d in (("missing", report.missing), ("empty", report.empty), ("placeholder mismatch", report.placeholder_mismatches)):
+            for msgid in d[lang]:
+                print(f"    {label}: {msgid!r}")
+    return 0 if report.ok else 1
@@ -0,0 +1,30 @@
+def cli_main():
+    import os
+    import sys
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(
+        prog="font-coverage",
+        description="Checks which languages each font supports, and writes the result to a file "
+                    "that DefaultFontPicker(font_coverage=...) can load.",
+    )
+    parser.add_argument("dirs", nargs="*", help="directories to scan (default: the pre-installed font directories)")
+    parser.add_argument("-o", "--output", help="the file to write the result to (default: stdout)")
+    parser.add_argument("-l", "--lang", action="append", dest="langs", help="a language to check (default: all of enum_langs())")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="the number of worker processes")
+    args = parser.parse_args()
+
+    # Kivy がコマンドライン引数を横取りしないように、読み込む前に設定しておく。
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    from pathlib import Path
+    from kivy_garden.i18n.fontfinder import compute_font_coverage, save_font_coverage, default_filter, _dump_font_coverage
+
+    if args.dirs:
+        fonts = [child for dir in args.dirs for child in sorted(Path(dir).iterdir()) if default_filter(child)]
+    else:
+        fonts = None
+    coverage = compute_font_coverage(fonts, args.langs, max_workers=args.jobs)
+    if args.output is None:
+        print(_dump_font_coverage(coverage))
+    else:
+        save_font_coverage(coverage, args.output)
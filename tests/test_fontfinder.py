@@ -92,3 +92,120 @@ class Test_register_lang:
         from kivy_garden.i18n.fontfinder import register_lang, DISCRIMINANTS
         register_lang("xxx", "ABCD")
         assert DISCRIMINANTS["xxx"] == "ABCD"
+
+    def test_normalized_lang(self):
+        from kivy_garden.i18n.fontfinder import register_lang, DISCRIMINANTS
+        register_lang("xx-yy", "ABCD")
+        assert DISCRIMINANTS["xx_YY"] == "ABCD"
+
+
+@p("lang", "zh-TW zh_TW zh-Hant-HK zh_CN ja-JP ko_KR".split())
+def test_font_supports_regional_lang(lang):
+    from kivy_garden.i18n.fontfinder import font_supports_lang
+    assert not font_supports_lang("Roboto", lang)
+
+
+def test_font_supports_unknown_lang():
+    from kivy_garden.i18n.fontfinder import font_supports_lang
+    with pytest.raises(ValueError):
+        font_supports_lang("Roboto", "qq_BR")
+
+
+class Test_font_coverage:
+    @p("max_workers", [1, 2, ])
+    def test_compute(self, cjk_font, max_workers):
+        from kivy_garden.i18n.fontfinder import compute_font_coverage
+        fonts = ["Roboto", "RobotoMono-Regular"]
+        if cjk_font is not None:
+            fonts.append(str(cjk_font))
+        coverage = compute_font_coverage(fonts, ["zh", "ko", "ja"], max_workers=max_workers)
+        assert list(coverage) == fonts
+        assert coverage["Roboto"] == ()
+        if cjk_font is not None:
+            assert coverage[str(cjk_font)] == ("zh", "ko", "ja", )
+
+    def test_normalize_langs(self):
+        from kivy_garden.i18n.fontfinder import compute_font_coverage
+        assert compute_font_coverage(["Roboto"], ["en-us", "en_US", "zh-TW"], max_workers=1) == {"Roboto": ("en_US", )}
+
+    def test_broken_font(self, tmp_path):
+        from kivy_garden.i18n.fontfinder import compute_font_coverage
+        font = tmp_path / "broken.ttf"
+        font.write_bytes(b"not a font")
+        assert compute_font_coverage([font], ["ja"]) == {str(font): ()}
+
+    def test_save_and_load(self, tmp_path):
+        from kivy_garden.i18n.fontfinder import save_font_coverage, load_font_coverage
+        coverage = {"a.ttf": ("ja", "ko", ), "b.ttf": (), }
+        file = tmp_path / "coverage.json"
+        save_font_coverage(coverage, file)
+        assert load_font_coverage(file) == coverage
+
+    def test_load_invalid_file(self, tmp_path):
+        from kivy_garden.i18n.fontfinder import load_font_coverage
+        file = tmp_path / "coverage.json"
+        file.write_text('{"a.ttf": ["ja"]}')
+        with pytest.raises(ValueError):
+            load_font_coverage(file)
+
+
+def test_builtin_discriminants():
+    from kivy_garden.i18n.fontfinder import DISCRIMINANTS, _validate_discriminant, normalize_lang
+    for lang, discriminant in DISCRIMINANTS.items():
+        assert lang == normalize_lang(lang)
+        assert _validate_discriminant(discriminant), lang
+
+
+@p("lang", "en fr de pl cs tr vi el ru uk sr".split())
+def test_roboto_supports_latin_greek_cyrillic(lang):
+    from kivy_garden.i18n.fontfinder import font_supports_lang
+    assert font_supports_lang("Roboto", lang)
+
+
+@p("lang", "ar he th hi bn ta ka am".split())
+def test_roboto_doesnt_support_other_scripts(lang):
+    from kivy_garden.i18n.fontfinder import font_supports_lang
+    assert not font_supports_lang("Roboto", lang)
+
+
+def test_adaptive_order():
+    from kivy_garden.i18n.fontfinder import font_supports_lang, register_lang, _lang2discriminant
+    register_lang("xx", "ABC漢字한글")
+    assert not font_supports_lang("Roboto", "xx")
+    # The glyphs that Roboto lacks are tried first from now on.
+    glyphs = _lang2discriminant["xx"]
+    assert sorted(glyphs) == sorted("ABC漢字한글")
+    assert set(glyphs[:2]) <= set("漢字한글")
+    assert not font_supports_lang("Roboto", "xx")
+
+
+class Test_fonts_support_langs:
+    def test_roboto(self, cjk_font):
+        from kivy_garden.i18n.fontfinder import fonts_support_langs
+        fonts = ["Roboto", "Roboto"]
+        if cjk_font is not None:
+            fonts.append(cjk_font)
+        matrix = fonts_support_langs(fonts, ["en", "ja", "ru", "ko"])
+        assert matrix[:2] == [[True, False, True, False]] * 2
+        if cjk_font is not None:
+            assert matrix[2] == [True, True, True, True]
+
+    def test_same_as_font_supports_lang(self):
+        from kivy_garden.i18n.fontfinder import fonts_support_langs, font_supports_lang, enum_langs
+        langs = list(enum_langs())
+        assert fonts_support_langs(["Roboto"], langs) == [[font_supports_lang("Roboto", lang) for lang in langs]]
+
+    def test_unknown_lang(self):
+        from kivy_garden.i18n.fontfinder import fonts_support_langs
+        with pytest.raises(ValueError):
+            fonts_support_langs(["Roboto"], ["en", "qq"])
+
+
+def test_glyph_probe_renders_each_glyph_once():
+    from kivy_garden.i18n.fontfinder import _GlyphProbe
+    probe = _GlyphProbe("Roboto")
+    digests = probe.digests("ABC")
+    assert len(set(digests)) == 3
+    assert probe.digests("CBA") == digests[::-1]
+    assert probe.digests("漢字") == probe.digests("字漢")
+    assert len(probe._digests) == 5
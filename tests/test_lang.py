@@ -0,0 +1,32 @@
+import pytest
+p = pytest.mark.parametrize
+
+
+@p("lang, outcome", [
+    ("en", "en"),
+    ("EN", "en"),
+    ("pt-br", "pt_BR"),
+    ("pt_BR", "pt_BR"),
+    ("zh-hant", "zh_Hant"),
+    ("zh-Hant-TW", "zh_Hant_TW"),
+    ("es-419", "es_419"),
+    ("ja_JP.UTF-8", "ja_JP"),
+    ("sr_RS@latin", "sr_RS"),
+])
+def test_normalize_lang(lang, outcome):
+    from kivy_garden.i18n._lang import normalize_lang
+    assert normalize_lang(lang) == outcome
+
+
+@p("lang, default, outcome", [
+    ("en", None, ("en", )),
+    ("en", "en", ("en", )),
+    ("pt-BR", None, ("pt_BR", "pt", )),
+    ("pt-BR", "en", ("pt_BR", "pt", "en", )),
+    ("zh-TW", None, ("zh_TW", "zh_Hant", "zh", )),
+    ("zh_CN", None, ("zh_CN", "zh_Hans", "zh", )),
+    ("zh-Hant-HK", None, ("zh_Hant_HK", "zh_Hant", "zh", )),
+])
+def test_lang_fallbacks(lang, default, outcome):
+    from kivy_garden.i18n._lang import lang_fallbacks
+    assert lang_fallbacks(lang, default) == outcome
@@ -117,6 +117,296 @@ def test_compile_incomplete_translations(strict):
     })
     with pytest.raises(ValueError) if strict else nullcontext():
         assert _compile_translations(source, strict=strict) == {
-            "ko": {"greeting": "안녕", "apple": "apple", },
+            "ko": {"greeting": "안녕", },
             'zh': {"greeting": "安安", "apple": "蘋果", },
         }
+
+
+@pytest.mark.parametrize("strict", [True, False])
+def test_MappingBasedTranslatorFactory_mixed_spellings(strict):
+    from kivy_garden.i18n.localizer import MappingBasedTranslatorFactory
+    factory = MappingBasedTranslatorFactory({
+        'a': {'pt-BR': 'x', },
+        'b': {'pt_BR': 'y', },
+        'c': {'pt-br': 'z', },
+    }, strict=strict)
+    _ = factory('pt_BR')
+    assert (_('a'), _('b'), _('c')) == ('x', 'y', 'z', )
+
+
+def test_MappingBasedTranslatorFactory_fallback():
+    from kivy_garden.i18n.localizer import MappingBasedTranslatorFactory
+    factory = MappingBasedTranslatorFactory({
+        'bus': {
+            'pt': 'autocarro',
+            'pt-BR': 'ônibus',
+            'en': 'Bus',
+        },
+        'train': {
+            'pt': 'comboio',
+            'en': 'Train',
+        },
+        'tram': {
+            'en': 'Tram',
+        },
+    }, default_lang='en')
+    _ = factory('pt_BR')
+    assert _('bus') == 'ônibus'
+    assert _('train') == 'comboio'
+    assert _('tram') == 'Tram'
+    assert factory('pt-BR') is factory('pt-BR')
+    _ = factory('pt_PT')
+    assert _('bus') == 'autocarro'
+    assert _('tram') == 'Tram'
+    _ = factory('fr')
+    assert _('bus') == 'Bus'
+
+
+def test_MappingBasedTranslatorFactory_unknown_lang():
+    from kivy_garden.i18n.localizer import MappingBasedTranslatorFactory
+    factory = MappingBasedTranslatorFactory({'bus': {'pt': 'autocarro', }, })
+    assert factory('pt_BR')('bus') == 'autocarro'
+    with pytest.raises(KeyError):
+        factory('fr')
+
+
+def test_GettextBasedTranslatorFactory_fallback():
+    from pathlib import PurePath
+    from kivy_garden.i18n.localizer import GettextBasedTranslatorFactory
+    factory = GettextBasedTranslatorFactory(
+        'test_localizer',
+        PurePath(__file__).parent / 'locales',
+        default_lang='en',
+    )
+    _ = factory('zh-TW')
+    assert _("greeting") == '早安'
+    assert _("unknown msgid") == 'unknown msgid'
+    assert factory('zh-TW') is _
+    _ = factory('fr')
+    assert _("greeting") == 'morning'
+
+
+def test_DefaultFontPicker_fallback():
+    from kivy_garden.i18n.localizer import DefaultFontPicker
+    picker = DefaultFontPicker()
+    assert picker('pt_BR') == 'Roboto'
+    assert picker('en-US') == 'Roboto'
+
+
+@pytest.mark.parametrize("from_file", [True, False])
+def test_DefaultFontPicker_font_coverage(tmp_path, from_file):
+    from kivy_garden.i18n.fontfinder import save_font_coverage
+    from kivy_garden.i18n.localizer import DefaultFontPicker
+    coverage = {
+        "/fonts/a.ttf": ("ar", ),
+        "/fonts/cjk.ttc": ("ja", "ko", "zh_Hant", ),
+        "/fonts/cjk2.ttc": ("ja", ),
+    }
+    if from_file:
+        save_font_coverage(coverage, file := tmp_path / "coverage.json")
+        coverage = file
+    picker = DefaultFontPicker(font_coverage=coverage)
+    assert picker("ja") == "/fonts/cjk.ttc"
+    assert picker("zh-TW") == "/fonts/cjk.ttc"
+    assert picker("ar") == "/fonts/a.ttf"
+    assert picker("en") == "Roboto"
+
+
+@pytest.mark.parametrize("lang", "en cs de es fr hu it pl pt ro tr vi el be bg kk ru sr uk".split())
+def test_DefaultFontPicker_preset(lang):
+    from kivy_garden.i18n.fontfinder import font_supports_lang
+    from kivy_garden.i18n.localizer import DefaultFontPicker
+    assert font_supports_lang("Roboto", lang)
+    picker = DefaultFontPicker()
+    assert picker(lang) == "Roboto"
+    assert picker.n_fonts_probed == 0
+
+
+def test_DefaultFontPicker_tries_default_font_first(monkeypatch):
+    from kivy_garden.i18n.fontfinder import DISCRIMINANTS
+    from kivy_garden.i18n.localizer import DefaultFontPicker
+    monkeypatch.setitem(DISCRIMINANTS, 'qq', 'ABCDE')
+    picker = DefaultFontPicker()
+    assert picker('qq') == 'Roboto'
+    assert picker.n_fonts_probed == 1
+
+
+def test_DefaultFontPicker_font_coverage_unnormalized():
+    from kivy_garden.i18n.localizer import DefaultFontPicker
+    picker = DefaultFontPicker(font_coverage={"/fonts/cjk.ttc": ("zh-tw", ), })
+    assert picker("zh_TW") == "/fonts/cjk.ttc"
+    assert picker.n_fonts_probed == 0
+
+
+class Test_PseudoTranslatorFactory:
+    def test_wraps_factory(self):
+        from kivy_garden.i18n.localizer import Localizer, MappingBasedTranslatorFactory, PseudoTranslatorFactory
+        factory = PseudoTranslatorFactory(MappingBasedTranslatorFactory({
+            'greeting': {'en': 'morning', 'zh': '早安', },
+        }), expansion=0.5)
+        loc = Localizer(factory, font_picker=lambda lang: 'Roboto')
+        assert loc._('greeting') == '[möŕñîñĝ ~~~~]'
+        loc.lang = 'zh'
+        assert loc._('greeting') == '[早安 ~]'
+
+    def test_msgid(self):
+        from kivy_garden.i18n.localizer import PseudoTranslatorFactory
+        _ = PseudoTranslatorFactory(expansion=0)('en')
+        assert _('Hello') == '[Ĥéļļö]'
+        assert _('Hello') is _('Hello')
+
+    @pytest.mark.parametrize("text", ["{name} is {age:>3}", "%(n)d / %s %.2f", ])
+    def test_placeholders_are_kept(self, text):
+        from kivy_garden.i18n.localizer import PseudoTranslatorFactory
+        from kivy_garden.i18n.utils import check_translations
+        f = PseudoTranslatorFactory()
+        assert check_translations({text: {'xx': f.pseudo_translate(text), }, }).ok
+
+    def test_percent_sign_is_not_a_placeholder(self):
+        from kivy_garden.i18n.localizer import PseudoTranslatorFactory
+        f = PseudoTranslatorFactory(expansion=0)
+        assert f.pseudo_translate('50% off') == '[50% öff]'
+        assert f.pseudo_translate('100%% done {{not}} {name}') == '[100%% ðöñé {{ñöţ}} {name}]'
+
+    def test_options(self):
+        from kivy_garden.i18n.localizer import PseudoTranslatorFactory
+        f = PseudoTranslatorFactory(expansion=1, accents=False, rtl=True, cjk_padding=True)
+        assert f.pseudo_translate('Hello') == '\u202e[Hello 漢字한글か]\u202c'
+        assert PseudoTranslatorFactory(expansion=1.9).pseudo_translate('ab') == '[åƀ ~~~~]'
+
+    def test_invalid_expansion(self):
+        from kivy_garden.i18n.localizer import PseudoTranslatorFactory
+        with pytest.raises(ValueError):
+            PseudoTranslatorFactory(expansion=-0.1)
+
+    def test_factory_caches_translators(self):
+        from kivy_garden.i18n.localizer import PseudoTranslatorFactory
+        f = PseudoTranslatorFactory()
+        assert f('en') is f('en')
+        assert f('en') is not f('zh')
+
+
+class Test_TranslationBundle:
+    @pytest.fixture()
+    def loc(self):
+        from kivy_garden.i18n.localizer import Localizer, MappingBasedTranslatorFactory
+        return Localizer(
+            MappingBasedTranslatorFactory({'greeting': {'zh': '早安', 'en': 'morning', }, }),
+            font_picker={'zh': 'RobotoMono-Regular', 'en': 'Roboto', }.__getitem__,
+            max_loaded_bundles=2,
+        )
+
+    @staticmethod
+    def counting_factory(translations, calls):
+        from kivy_garden.i18n.localizer import MappingBasedTranslatorFactory
+        factory = MappingBasedTranslatorFactory(translations)
+
+        def counting_factory(lang):
+            calls.append(lang)
+            return factory(lang)
+        return counting_factory
+
+    def test_lazy_loading(self, loc):
+        calls = []
+        bundle = loc.add_bundle('tiger', self.counting_factory({'tiger': {'zh': '老虎', 'en': 'Tiger', }, }, calls))
+        assert loc.get_bundle('tiger') is bundle
+        assert not bundle.loaded
+        assert calls == []
+        assert bundle._('tiger') == 'Tiger'
+        assert bundle._('tiger') == 'Tiger'
+        assert bundle.loaded
+        assert calls == ['en', ]
+        loc.lang = 'zh'
+        assert not bundle.loaded
+        assert (bundle.lang, bundle.font_name) == ('zh', 'RobotoMono-Regular')
+        assert bundle._('tiger') == '老虎'
+        assert calls == ['en', 'zh', ]
+
+    def test_preload(self, loc):
+        calls = []
+        bundle = loc.add_bundle('tiger', self.counting_factory({'tiger': {'en': 'Tiger', }, }, calls), preload=True)
+        assert bundle.loaded
+        assert calls == ['en', ]
+
+    def test_duplicated_name(self, loc):
+        loc.add_bundle('tiger', lambda lang: lambda msgid: msgid)
+        with pytest.raises(ValueError):
+            loc.add_bundle('tiger', lambda lang: lambda msgid: msgid)
+        loc.remove_bundle('tiger')
+        with pytest.raises(KeyError):
+            loc.get_bundle('tiger')
+
+    def test_lru(self, loc):
+        calls = []
+        bundles = [
+            loc.add_bundle(name, self.counting_factory({'msgid': {'en': name, }, }, calls))
+            for name in ('a', 'b', 'c', )
+        ]
+        a, b, c = bundles
+        a._('msgid')
+        b._('msgid')
+        a._('msgid')
+        c._('msgid')  # 'b' is the least recently used one
+        assert [x.loaded for x in bundles] == [True, False, True, ]
+        assert b._('msgid') == 'b'
+        assert [x.loaded for x in bundles] == [False, True, True, ]
+        assert calls == ['en', ] * 4
+        loc.unload_bundles()
+        assert not any(x.loaded for x in bundles)
+
+    @pytest.mark.parametrize("pseudo", [False, True])
+    def test_unloading_frees_translations(self, loc, pseudo):
+        import gc
+        import weakref
+        import gettext
+        from pathlib import PurePath
+        from kivy_garden.i18n.localizer import GettextBasedTranslatorFactory, PseudoTranslatorFactory
+        factory = GettextBasedTranslatorFactory('test_localizer', PurePath(__file__).parent / 'locales')
+        if pseudo:
+            factory = PseudoTranslatorFactory(factory)
+        bundle = loc.add_bundle('a', factory)
+        n_cached = len(gettext._translations)
+
+        bundle._('greeting')
+        ref = weakref.ref(bundle._._translator)
+        loc.unload_bundles()
+        gc.collect()
+        assert ref() is None
+        assert factory._translators == {}
+        assert len(gettext._translations) == n_cached
+
+        bundle._('greeting')
+        ref = weakref.ref(bundle._._translator)
+        loc.lang = 'zh'
+        gc.collect()
+        assert ref() is None
+        assert bundle._('greeting') == ('[早安 ~]' if pseudo else '早安')
+
+    def test_mapping_based_factory_builds_tables_lazily(self, loc):
+        from kivy_garden.i18n.localizer import MappingBasedTranslatorFactory
+        factory = MappingBasedTranslatorFactory({'tiger': {'zh': '老虎', 'en': 'Tiger', }, })
+        bundle = loc.add_bundle('tiger', factory)
+        assert factory._translators == {}
+        assert bundle._('tiger') == 'Tiger'
+        assert list(factory._translators) == ['en', ]
+        loc.lang = 'zh'
+        assert factory._translators == {}
+        assert bundle._('tiger') == '老虎'
+        assert list(factory._translators) == ['zh', ]
+        loc.remove_bundle('tiger')
+        assert factory._translators == {}
+
+    def test_kv_binding(self, loc):
+        from textwrap import dedent
+        from kivy.lang import Builder
+        bundle = loc.add_bundle('tiger', self.counting_factory({'tiger': {'zh': '老虎', 'en': 'Tiger', }, }, []))
+        bundle.install(name='lt')
+        label = Builder.load_string(dedent("""
+            Label:
+                font_name: lt.font_name
+                text: lt._("tiger")
+            """))
+        bundle.uninstall(name='lt')
+        assert (label.text, label.font_name) == ('Tiger', 'Roboto')
+        loc.lang = 'zh'
+        assert (label.text, label.font_name) == ('老虎', 'RobotoMono-Regular')
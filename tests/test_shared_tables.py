@@ -0,0 +1,184 @@
+import pytest
+
+
+@pytest.fixture()
+def name():
+    import os
+    return f"kgi18n_test_{os.getpid()}"
+
+
+@pytest.fixture()
+def publisher(name):
+    from kivy_garden.i18n.shared_tables import SharedTablePublisher
+    publisher = SharedTablePublisher(name)
+    yield publisher
+    publisher.close()
+
+
+TRANSLATIONS = {
+    'bus': {'pt': 'autocarro', 'pt-BR': 'ônibus', 'en': 'Bus', },
+    'train': {'pt': 'comboio', 'en': 'Train', },
+    'tram': {'en': 'Tram', },
+}
+
+
+def test_lookup(publisher, name):
+    from kivy_garden.i18n.shared_tables import SharedTableTranslatorFactory
+    assert publisher.publish(TRANSLATIONS, default_lang='en') == 1
+    factory = SharedTableTranslatorFactory(name)
+    _ = factory('pt_BR')
+    assert _('bus') == 'ônibus'
+    assert _('train') == 'comboio'
+    assert _('tram') == 'Tram'
+    assert _('unknown msgid') == 'unknown msgid'
+    assert factory('pt-BR') is factory('pt-BR')
+    assert factory('pt_PT')('bus') == 'autocarro'
+    assert factory('fr')('bus') == 'Bus'
+
+
+def test_no_default_lang(publisher, name):
+    from kivy_garden.i18n.shared_tables import SharedTableTranslatorFactory
+    publisher.publish(TRANSLATIONS)
+    factory = SharedTableTranslatorFactory(name)
+    assert factory('pt_BR')('tram') == 'tram'
+    with pytest.raises(KeyError):
+        factory('fr')
+
+
+def test_same_as_MappingBasedTranslatorFactory(publisher, name):
+    from kivy_garden.i18n.localizer import MappingBasedTranslatorFactory
+    from kivy_garden.i18n.shared_tables import SharedTableTranslatorFactory
+    translations = {
+        f"msgid {i}": {lang: f"{lang} {i} 翻訳" for lang in ('en', 'ja', 'zh') if (i + len(lang)) % 3}
+        for i in range(1000)
+    }
+    publisher.publish(translations)
+    shared = SharedTableTranslatorFactory(name)
+    mapping = MappingBasedTranslatorFactory(translations)
+    for lang in ('en', 'ja', 'zh'):
+        assert [shared(lang)(msgid) for msgid in translations] == [mapping(lang)(msgid) for msgid in translations]
+
+
+def test_republish(publisher, name):
+    from kivy_garden.i18n.shared_tables import SharedTableTranslatorFactory
+    publisher.publish({'bus': {'en': 'Bus', }, })
+    factory = SharedTableTranslatorFactory(name)
+    old = factory('en')
+    assert factory.version == 1
+    assert publisher.publish({'bus': {'en': 'Coach', }, }) == 2
+    new = factory('en')
+    assert factory.version == 2
+    assert new('bus') == 'Coach'
+    # The translators created before the republishing keep working.
+    assert old('bus') == 'Bus'
+
+
+def test_refresh(publisher, name):
+    from kivy_garden.i18n.localizer import Localizer
+    from kivy_garden.i18n.shared_tables import SharedTableTranslatorFactory
+    publisher.publish({'bus': {'en': 'Bus', }, 'train': {'en': 'Train', }, })
+    factory = SharedTableTranslatorFactory(name)
+    loc = Localizer(factory, font_picker=lambda lang: 'Roboto')
+    bundle = loc.add_bundle('a', factory)
+    assert (loc._('bus'), bundle._('train')) == ('Bus', 'Train')
+    assert not factory.refresh(loc)
+    publisher.publish({'bus': {'en': 'Coach', }, 'train': {'en': 'Railway', }, })
+    assert factory.refresh(loc)
+    assert factory.version == 2
+    assert (loc._('bus'), bundle._('train')) == ('Coach', 'Railway')
+    assert not factory.refresh(loc)
+
+
+def test_publisher_and_factory_in_one_process():
+    # A segment that the process created itself must stay registered to the resource tracker,
+    # otherwise unlinking it makes the tracker print KeyError tracebacks.
+    import os
+    import sys
+    import subprocess
+    from textwrap import dedent
+    code = dedent(f"""
+        from kivy_garden.i18n.shared_tables import SharedTablePublisher, SharedTableTranslatorFactory
+        publisher = SharedTablePublisher("kgi18n_test_one_process_{os.getpid()}")
+        publisher.publish({{'bus': {{'en': 'Bus', }}, }})
+        factory = SharedTableTranslatorFactory(publisher.name)
+        assert factory('en')('bus') == 'Bus'
+        publisher.publish({{'bus': {{'en': 'Coach', }}, }})
+        assert factory('en')('bus') == 'Coach'
+        publisher.close()
+        """)
+    r = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, encoding='utf-8')
+    assert r.returncode == 0, r.stderr
+    assert 'Traceback' not in r.stderr
+    assert 'leaked' not in r.stderr
+
+
+@pytest.mark.parametrize("start_method", ["spawn", "fork", ])
+def test_multiprocessing_child(tmp_path, start_method):
+    # A child started by multiprocessing shares the resource tracker with its parent,
+    # so it must not unregister the segments the parent published.
+    import os
+    import sys
+    import subprocess
+    import multiprocessing
+    from textwrap import dedent
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{start_method!r} is not available")
+    script = tmp_path / "mp_child.py"
+    script.write_text(dedent(f"""
+        import multiprocessing as mp
+        from kivy_garden.i18n.shared_tables import SharedTablePublisher, SharedTableTranslatorFactory
+
+        def child(name, attached, republished):
+            factory = SharedTableTranslatorFactory(name)
+            assert factory('en')('bus') == 'Bus'
+            attached.set()
+            republished.wait()
+            assert factory('en')('bus') == 'Coach'
+
+        if __name__ == '__main__':
+            ctx = mp.get_context({start_method!r})
+            attached = ctx.Event()
+            republished = ctx.Event()
+            publisher = SharedTablePublisher("kgi18n_test_mp_{os.getpid()}")
+            publisher.publish({{'bus': {{'en': 'Bus', }}, }})
+            p = ctx.Process(target=child, args=(publisher.name, attached, republished, ))
+            p.start()
+            assert attached.wait(30)
+            publisher.publish({{'bus': {{'en': 'Coach', }}, }})
+            republished.set()
+            p.join()
+            assert p.exitcode == 0
+            publisher.publish({{'bus': {{'en': 'Tram', }}, }})
+            publisher.close()
+        """), encoding='utf-8')
+    r = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, encoding='utf-8')
+    assert r.returncode == 0, r.stderr
+    assert 'Traceback' not in r.stderr
+    assert 'leaked' not in r.stderr
+
+
+def test_nothing_published(publisher, name):
+    from kivy_garden.i18n.shared_tables import SharedTableTranslatorFactory
+    factory = SharedTableTranslatorFactory(name)
+    with pytest.raises(LookupError):
+        factory('en')
+
+
+def test_no_publisher():
+    from kivy_garden.i18n.shared_tables import SharedTableTranslatorFactory
+    with pytest.raises(FileNotFoundError):
+        SharedTableTranslatorFactory("kgi18n_test_no_such_publisher")
+
+
+def test_another_process(publisher, name):
+    import sys
+    import subprocess
+    from textwrap import dedent
+    publisher.publish(TRANSLATIONS)
+    code = dedent(f"""
+        from kivy_garden.i18n.shared_tables import SharedTableTranslatorFactory
+        print(SharedTableTranslatorFactory({name!r})('pt_BR')('bus'))
+        """)
+    for __ in range(2):
+        r = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, encoding='utf-8', check=True)
+        assert r.stdout.strip() == 'ônibus'
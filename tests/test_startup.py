@@ -0,0 +1,57 @@
+'''
+Guards against import-time regressions.
+
+``kivy.core.text`` initializes the text provider and ``kivy.uix.label`` pulls in most of the widget machinery,
+so they must not be loaded until a font check or a widget actually needs them.
+Run ``python -X importtime -c "import kivy_garden.i18n.localizer"`` to see where the time goes.
+'''
+
+import pytest
+p = pytest.mark.parametrize
+
+HEAVY_MODULES = ("kivy.core.text", "kivy.uix.label", "kivy.uix.widget", "kivy.graphics", "kivy.lang", )
+
+
+def run(code: str) -> list[str]:
+    import os
+    import sys
+    import subprocess
+    from textwrap import dedent
+    code = dedent(code) + dedent(f"""
+        import sys
+        print(*(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+        """)
+    r = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        env={"KIVY_NO_ARGS": "1", "KIVY_NO_CONSOLELOG": "1", "KIVY_NO_FILELOG": "1", **os.environ},
+    )
+    return r.stdout.split()
+
+
+@p("code", [
+    "import kivy_garden.i18n.fontfinder",
+    "import kivy_garden.i18n.localizer",
+    "import kivy_garden.i18n.utils",
+    """
+    from kivy_garden.i18n.localizer import Localizer, MappingBasedTranslatorFactory
+    loc = Localizer(MappingBasedTranslatorFactory({"greeting": {"en": "morning", }, }))
+    loc._("greeting")
+    loc.font_name
+    """,
+])
+def test_heavy_modules_are_not_loaded(code):
+    assert run(code) == []
+
+
+def test_utils_do_not_load_kivy():
+    assert run("""
+        import sys
+        import kivy_garden.i18n.utils
+        assert "kivy" not in sys.modules
+        """) == []
+
+
+def test_default_font_name():
+    from kivy.uix.label import Label
+    from kivy_garden.i18n.localizer import Localizer
+    assert Localizer.font_name.defaultvalue == Label.font_name.defaultvalue
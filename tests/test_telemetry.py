@@ -0,0 +1,75 @@
+import pytest
+
+
+@pytest.fixture()
+def factory():
+    from kivy_garden.i18n.localizer import MappingBasedTranslatorFactory
+    return MappingBasedTranslatorFactory({
+        'greeting': {'zh': '早安', 'en': 'morning', },
+    })
+
+
+def test_ring_buffer_sink(factory):
+    from textwrap import dedent
+    from kivy.lang import Builder
+    from kivy_garden.i18n.localizer import Localizer
+    from kivy_garden.i18n.telemetry import RingBufferSink, LangSwitchEvent
+
+    sink = RingBufferSink(maxlen=2)
+    font_picker = {'zh': 'RobotoMono-Regular', 'en': 'Roboto', }.__getitem__
+    loc = Localizer(factory, font_picker=font_picker, telemetry_sink=sink)
+    assert [e.lang for e in sink.events] == ['en', ]
+
+    loc.install(name='l')
+    label = Builder.load_string(dedent("""
+        Label:
+            font_name: l.font_name
+            text: l._("greeting")
+        """))
+    loc.uninstall(name='l')
+    loc.lang = 'zh'
+    assert label.text == '早安'
+    event = sink.events[-1]
+    assert isinstance(event, LangSwitchEvent)
+    assert event.lang == 'zh'
+    assert event.n_rebound_rules == 2
+    assert event.font_cache_hit is None
+    assert event.n_fonts_probed is None
+    assert event.total_time >= event.rebind_time >= 0.
+
+    loc.lang = 'en'
+    loc.lang = 'zh'
+    assert [e.lang for e in sink.events] == ['en', 'zh', ]
+
+
+def test_default_font_picker_stats(factory, monkeypatch):
+    import kivy_garden.i18n.localizer as localizer
+    # No pre-installed fonts, so only the default font is inspected for 'zh'.
+    monkeypatch.setattr(localizer, 'enum_pre_installed_fonts', lambda: iter(()))
+    events = []
+    loc = localizer.Localizer(factory, telemetry_sink=events.append)
+    assert events[-1].font_cache_hit is True
+    assert events[-1].n_fonts_probed == 0
+    assert events[-1].n_rebound_rules == 0
+    loc.lang = 'zh'
+    assert events[-1].font_cache_hit is False
+    assert events[-1].n_fonts_probed == 1
+    loc.lang = 'en'
+    loc.lang = 'zh'
+    assert events[-1].font_cache_hit is True
+    assert events[-1].n_fonts_probed == 0
+
+
+def test_log_sink(factory, monkeypatch):
+    from kivy.logger import Logger
+    from kivy_garden.i18n.localizer import Localizer
+    from kivy_garden.i18n.telemetry import log_sink
+    messages = []
+    monkeypatch.setattr(Logger, 'info', messages.append)
+    loc = Localizer(factory, font_picker=lambda lang: 'Roboto', telemetry_sink=log_sink)
+    loc.lang = 'zh'
+    assert len(messages) == 2
+    msg = messages[-1]
+    assert msg.startswith("kivy_garden.i18n: Switched to lang 'zh' in ")
+    for field in ('translator_factory: ', 'font_picker: ', 'cache hit: None', 'fonts probed: None', 'rebind: ', 'rules: 0', ):
+        assert field in msg
@@ -0,0 +1,129 @@
+import pytest
+p = pytest.mark.parametrize
+from pathlib import PurePath
+
+
+@pytest.fixture(scope='module')
+def check():
+    from kivy_garden.i18n.utils import check_translations as f
+    return f
+
+
+def test_complete(check):
+    report = check({
+        'greeting': {'ko': '안녕', 'zh': '早安', },
+        'tiger': {'ko': '호랑이', 'zh': '老虎', },
+    })
+    assert report.ok
+    assert report.langs == ('ko', 'zh', )
+    assert report.coverage == {'ko': 100., 'zh': 100., }
+
+
+def test_missing_and_empty(check):
+    report = check({
+        'greeting': {'ko': '안녕', 'zh': '', },
+        'tiger': {'zh': '老虎', },
+        'apple': {'zh': '蘋果', },
+    })
+    assert not report.ok
+    assert report.missing == {'ko': ['tiger', 'apple', ], 'zh': [], }
+    assert report.empty == {'ko': [], 'zh': ['greeting', ], }
+    assert report.coverage == {'ko': pytest.approx(100 / 3), 'zh': pytest.approx(200 / 3), }
+
+
+def test_langs(check):
+    report = check({'greeting': {'ko': '안녕', }, }, langs=['ko', 'ja', ])
+    assert report.langs == ('ko', 'ja', )
+    assert report.missing == {'ko': [], 'ja': ['greeting', ], }
+
+
+def test_empty_table(check):
+    report = check({}, langs=['ko', ])
+    assert report.ok
+    assert report.coverage == {'ko': 100., }
+
+
+@p("msgid, msgstr, mismatch", [
+    ("hello", "안녕", False),
+    ("hello {name}", "{name} 안녕", False),
+    ("hello {name}", "안녕", True),
+    ("hello {name}", "{nam} 안녕", True),
+    ("hello", "{name} 안녕", True),
+    ("%(n)d apples", "사과 %(n)d개", False),
+    ("%(n)d apples", "사과 %(n)s개", True),
+    ("%s and %s", "%s 와 %s", False),
+    ("%s and %s", "%s", True),
+    ("Battery at 50% and charging", "Batterie à 50 % et en charge", False),
+    ("100%% done %s", "%s 100%% fini", False),
+    ("100%% done %s", "100%% fini", True),
+    ("Use {{braces}}", "Utilisez {{accolades}}", False),
+    ("{{literal}} {name}", "{name} {{littéral}}", False),
+])
+def test_placeholder_mismatches(check, msgid, msgstr, mismatch):
+    report = check({msgid: {'ko': msgstr, }, })
+    assert report.placeholder_mismatches == {'ko': [msgid, ] if mismatch else [], }
+
+
+def test_load_catalogs():
+    from kivy_garden.i18n.utils import load_catalogs
+    d = load_catalogs('test_localizer', PurePath(__file__).parent / 'locales')
+    assert d == {
+        'greeting': {'en': 'morning', 'zh': '早安', },
+        'tiger': {'en': 'Tiger', 'zh': '老虎', },
+    }
+
+
+@p("suffix", [".po", ".mo", ])
+def test_load_catalogs_po_mo(tmp_path, suffix):
+    import shutil
+    from kivy_garden.i18n.utils import load_catalogs
+    src = PurePath(__file__).parent / 'locales' / 'zh' / 'LC_MESSAGES' / ('test_localizer' + suffix)
+    dst = tmp_path / 'zh' / 'LC_MESSAGES'
+    dst.mkdir(parents=True)
+    shutil.copy(src, dst)
+    assert load_catalogs('test_localizer', tmp_path) == {
+        'greeting': {'zh': '早安', },
+        'tiger': {'zh': '老虎', },
+    }
+
+
+def test_load_po_multiline_and_plural(tmp_path):
+    from textwrap import dedent
+    from kivy_garden.i18n.utils._check_translations import _load_po
+    po = tmp_path / 'a.po'
+    po.write_text(dedent(r'''
+        msgid ""
+        msgstr ""
+        "Content-Type: text/plain; charset=UTF-8\n"
+
+        # comment
+        msgid "long "
+        "text"
+        msgstr ""
+        "長い"
+        "文章\n"
+
+        msgctxt "menu"
+        msgid "open"
+        msgstr "開く"
+
+        msgid "%d apple"
+        msgid_plural "%d apples"
+        msgstr[0] "%d個の林檎"
+        msgstr[1] "unused"
+
+        msgid "untranslated"
+        msgstr ""
+
+        #: src/main.py:10
+        #, fuzzy, python-format
+        msgid "fuzzy %s"
+        msgstr "曖昧 %s"
+        '''), encoding='utf-8')
+    assert _load_po(po) == {
+        '': 'Content-Type: text/plain; charset=UTF-8\n',
+        'long text': '長い文章\n',
+        'menu\x04open': '開く',
+        '%d apple': '%d個の林檎',
+        'untranslated': '',
+    }